@@ -1,9 +1,16 @@
 import calendar
 import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from typing import List, Union
+from functools import lru_cache, partial
+from itertools import combinations
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import requests
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -47,11 +54,53 @@ from enums.aws_lambda import (
 from enums.aws_lambda import (
     Term as AwsLambdaTerm,
 )
+from readers.cache import DEFAULT_CACHE_MAX_SIZE, load_cache, store_cache
+from readers.cur import (
+    COMPRESSION_SUFFIXES,
+    USAGE_COLUMNS,
+    Engine,
+    find_missing_columns,
+    iter_usage_csv,
+    read_header,
+)
+from readers.fixed_point import format_cost, sum_cost
+from readers.manifest import (
+    AGGREGATES_VERSION,
+    file_fingerprint,
+    load_manifest,
+    save_manifest,
+)
+from readers.parquet import is_parquet
 from services.amazon_ec2 import get_discount_rate as get_amazon_ec2_discount_rate
 from services.aws_fargate import get_discount_rate as get_aws_fargate_discount_rate
 from services.aws_lambda import get_discount_rate as get_aws_lambda_discount_rate
+from services.http_client import (
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    configure_http,
+)
+from services.matrix import (
+    DEFAULT_MATRIX_WORKERS,
+    PricingService,
+    build_combinations,
+    crawl_pricing,
+    get_discount_rate_matrix,
+    get_index_urls,
+)
+from services.pricing import (
+    DEFAULT_PRICING_CACHE_DIR,
+    DEFAULT_PRICING_CACHE_TTL,
+    configure_pricing_cache,
+    configure_pricing_snapshot,
+)
+from services.snapshot import write_snapshot
+from writers.output import OutputFormat, level_output_path, write_usage
 
 app = typer.Typer()
+pricing_app = typer.Typer(help="料金データを操作する")
+snapshot_app = typer.Typer(help="料金データのスナップショットを操作する")
+pricing_app.add_typer(snapshot_app, name="snapshot")
+app.add_typer(pricing_app, name="pricing")
 console = Console()
 
 
@@ -80,136 +129,896 @@ def get_days_in_month(month_str: str) -> int:
 
 
 def create_usage_table(
-    df: pd.DataFrame, title: str, markdown: bool = False
+    df: pd.DataFrame,
+    title: str,
+    markdown: bool = False,
+    max_rows: int = None,
+    formatters: Dict[str, Callable[[pd.Series], pd.Series]] = None,
 ) -> Union[Table, str]:
     """
     使用状況のテーブルを作成します。
 
+    値は列ごとにまとめて文字列に変換してから行を組み立てます。
+
     Args:
         df (pd.DataFrame): 使用状況データ
         title (str): テーブルのタイトル
         markdown (bool): markdown形式で出力するかどうか
+        max_rows (int, optional): 表示する最大行数（省略時は全ての行を表示）
+        formatters (Dict[str, Callable], optional): 列名ごとの、列を文字列の列に変換する関数
+            （指定のない列はstrで変換する）
 
     Returns:
         Union[Table, str]: 作成されたテーブルまたはmarkdown形式の文字列
     """
+    total_rows = len(df)
+    if max_rows and total_rows > max_rows:
+        df = df.head(max_rows)
+        footer = f"先頭{max_rows}行を表示（全{total_rows}行）"
+    else:
+        footer = None
+
+    # 列ごとに文字列へ変換する
+    headers = [str(column) for column in df.columns]
+    formatters = formatters or {}
+    values = [
+        formatters[column](df[column]) if column in formatters else df[column]
+        for column in df.columns
+    ]
+    values = [column.astype(str) for column in values]
+
     if markdown:
         # markdown形式で出力
         markdown_lines = []
         markdown_lines.append(f"## {title}\n")
 
         # ヘッダー行
-        headers = df.columns.tolist()
         markdown_lines.append("| " + " | ".join(headers) + " |")
         markdown_lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
 
         # データ行
-        for _, row in df.iterrows():
-            markdown_lines.append("| " + " | ".join(str(value) for value in row) + " |")
-
+        if values:
+            rows = "| " + values[0]
+            for column in values[1:]:
+                rows = rows + " | " + column
+            markdown_lines.extend((rows + " |").tolist())
+
+        if footer:
+            markdown_lines.append(f"\n{footer}")
         return "\n".join(markdown_lines)
     else:
         # rich.table形式で出力
-        table = Table(title=title)
-        for column in df.columns:
+        table = Table(title=title, caption=footer)
+        for column in headers:
             table.add_column(column)
-        for _, row in df.iterrows():
-            table.add_row(*[str(value) for value in row])
+        for row in zip(*(column.tolist() for column in values)):
+            table.add_row(*row)
         return table
 
 
-def get_usage_data(
+# 表に表示する最大行数の既定値
+DEFAULT_MAX_ROWS = 1000
+
+
+# サービスごとのusage_typeの抽出条件と表示タイトル
+SERVICES = {
+    "Fargate": ("Fargate", "Fargate使用状況"),
+    "EC2": ("Box", "EC2使用状況"),
+    "Lambda": ("Lambda-GB", "Lambda使用状況"),
+}
+
+
+# カテゴリ型で保持する使用状況データの列
+CATEGORY_COLUMNS = ["aws_account_id", "month", "usage_type", "item_description"]
+
+# 命名規則に沿ったファイル名（monthly-report-YYYY-MM-<account>.csv）
+REPORT_NAME_PATTERN = re.compile(r"monthly-report-(\d{4}-\d{2})-(\d+)\.")
+
+
+def get_group_keys(group_by: List[GroupBy]) -> List[str]:
+    """
+    グループ化のキーから集計に使用する列のリストを返します
+
+    Args:
+        group_by (List[GroupBy]): グループ化のキー
+
+    Returns:
+        List[str]: 集計に使用する列のリスト
+    """
+    group_keys = ["aws_account_id"]
+    if GroupBy.MONTH in group_by:
+        group_keys.append("month")
+    if GroupBy.USAGE_TYPE in group_by:
+        group_keys.append("usage_type")
+    if GroupBy.ITEM_DESCRIPTION in group_by:
+        group_keys.append("item_description")
+    return group_keys
+
+
+def expand_csv_files(csv_files: List[str]) -> List[str]:
+    """
+    ワイルドカードを展開してファイルリストを作成します
+
+    .csv で終わるパターンは、圧縮されたCSVファイル（.csv.gz, .csv.bz2, .csv.zst, .csv.zip）にも一致します。
+    ただし、展開済みのCSVファイル（x.csv）が一致した場合、同じ名前の圧縮ファイル（x.csv.gz）は除外します。
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス（ワイルドカード使用可）
+
+    Returns:
+        List[str]: 展開されたファイルのリスト
+    """
+    expanded_files = []
+    for pattern in csv_files:
+        matched_files = glob.glob(pattern)
+        # *.csv のパターンは圧縮されたCSVファイル（*.csv.gz など）にも一致させる
+        # （展開済みのファイルと同じ内容を二重に集計しないよう、展開済みのファイルを優先する）
+        if pattern.lower().endswith(".csv"):
+            plain_files = set(matched_files)
+            for suffix in COMPRESSION_SUFFIXES:
+                matched_files.extend(
+                    path
+                    for path in glob.glob(pattern + suffix)
+                    if path[: -len(suffix)] not in plain_files
+                )
+        if not matched_files:
+            console.print(
+                f"[yellow]警告: パターン '{pattern}' に一致するファイルが見つかりませんでした。[/yellow]"
+            )
+        expanded_files.extend(matched_files)
+    return expanded_files
+
+
+def check_files(csv_files: List[str]) -> List[str]:
+    """
+    全ファイルのヘッダーのみを並列で読み込み、必要な列がないファイルを除外します
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス
+
+    Returns:
+        List[str]: 必要な列がそろっているファイルのリスト
+    """
+
+    def check(csv_file: str) -> str:
+        try:
+            missing_columns = find_missing_columns(read_header(csv_file))
+        except Exception as e:
+            return str(e)
+        if missing_columns:
+            return f"{', '.join(missing_columns)} 列が見つかりません"
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(32, len(csv_files))) as executor:
+        errors = list(executor.map(check, csv_files))
+
+    checked_files = []
+    for csv_file, error in zip(csv_files, errors):
+        if error:
+            console.print(f"[yellow]スキップ:[/yellow] {csv_file}（{error}）")
+            continue
+        checked_files.append(csv_file)
+    return checked_files
+
+
+def validate_month(value: str) -> str:
+    """
+    年月文字列（YYYY-MM）の形式を検証します（typerのコールバック）
+
+    Args:
+        value (str): 年月文字列
+
+    Returns:
+        str: 検証済みの年月文字列
+    """
+    if value is not None and not re.fullmatch(r"\d{4}-(0[1-9]|1[0-2])", value):
+        raise typer.BadParameter(f"YYYY-MM形式で指定してください: {value}")
+    return value
+
+
+def prune_files(
+    csv_files: List[str],
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+) -> List[str]:
+    """
+    ファイル名に含まれる月とアカウントIDで、読み込むファイルを絞り込みます
+
+    ファイル名が命名規則（monthly-report-YYYY-MM-<account>.csv）に一致しない
+    ファイルは絞り込まずに残します（読み込み時に行単位で絞り込みます）。
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス
+        since (str, optional): 読み込む最初の月（YYYY-MM形式）
+        until (str, optional): 読み込む最後の月（YYYY-MM形式）
+        accounts (List[str], optional): 読み込むアカウントID
+
+    Returns:
+        List[str]: 絞り込まれたファイルのリスト
+    """
+    pruned_files = []
+    for csv_file in csv_files:
+        match = REPORT_NAME_PATTERN.match(os.path.basename(csv_file))
+        if match:
+            month, account = match.groups()
+            if since and month < since:
+                continue
+            if until and month > until:
+                continue
+            if accounts and account not in accounts:
+                continue
+        pruned_files.append(csv_file)
+    return pruned_files
+
+
+def filter_period(
+    df: pd.DataFrame,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+) -> pd.DataFrame:
+    """
+    月とアカウントIDで使用状況データを行単位で絞り込みます
+
+    Args:
+        df (pd.DataFrame): 使用状況データ
+        since (str, optional): 抽出する最初の月（YYYY-MM形式）
+        until (str, optional): 抽出する最後の月（YYYY-MM形式）
+        accounts (List[str], optional): 抽出するアカウントID
+
+    Returns:
+        pd.DataFrame: 絞り込まれた使用状況データ
+    """
+    if since or until:
+        # カテゴリ型の列でも比較できるよう、月の一覧に対して条件を判定する
+        months = [
+            month
+            for month in df["month"].dropna().unique()
+            if (not since or month >= since) and (not until or month <= until)
+        ]
+        df = df[df["month"].isin(months)]
+    if accounts:
+        df = df[df["aws_account_id"].isin(accounts)]
+    return df
+
+
+def sort_usage(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    使用状況データを月、usage_type、item_descriptionの順でソートします
+
+    Args:
+        df (pd.DataFrame): 使用状況データ
+
+    Returns:
+        pd.DataFrame: ソートされた使用状況データ
+    """
+    # ソートキーの列が存在する場合のみソート
+    sort_keys = []
+    if "month" in df.columns:
+        sort_keys.append("month")
+    if "usage_type" in df.columns:
+        sort_keys.append("usage_type")
+    if "item_description" in df.columns:
+        sort_keys.append("item_description")
+    if sort_keys:
+        df = df.sort_values(sort_keys)
+    return df
+
+
+@lru_cache(maxsize=None)
+def classify_usage_type(usage_type: str, patterns: Tuple[str, ...]) -> int:
+    """
+    usage_typeが一致するパターンをビットで返します（同じ値は一度だけ判定します）
+
+    Args:
+        usage_type (str): usage_typeの値
+        patterns (Tuple[str, ...]): usage_typeに含まれる文字列（正規表現、大文字小文字を区別しない）
+
+    Returns:
+        int: i番目のパターンに一致する場合にiビット目が立った値
+    """
+    bits = 0
+    for i, pattern in enumerate(patterns):
+        if re.search(pattern, usage_type, flags=re.IGNORECASE):
+            bits |= 1 << i
+    return bits
+
+
+@lru_cache(maxsize=None)
+def is_negation(item_description: str) -> bool:
+    """
+    item_descriptionがSavingsPlanNegationの行かどうかを返します（同じ値は一度だけ判定します）
+
+    Args:
+        item_description (str): item_descriptionの値
+
+    Returns:
+        bool: SavingsPlanNegationの行の場合はTrue
+    """
+    return "savingsplannegation" in item_description.lower()
+
+
+def map_categories(series: pd.Series, func: Callable, default) -> np.ndarray:
+    """
+    列の値の種類ごとに一度だけ関数を評価し、カテゴリのコードで全行に展開します
+
+    Args:
+        series (pd.Series): 列（カテゴリ型でない場合はカテゴリ型に変換します）
+        func (Callable): 値を受け取る関数
+        default: 欠損値の行の結果
+
+    Returns:
+        np.ndarray: 行ごとの関数の結果
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype("category")
+    # 欠損値のコード（-1）が末尾の既定値を参照するようにする
+    table = np.array([func(value) for value in series.cat.categories] + [default])
+    return table[series.cat.codes.to_numpy()]
+
+
+def classify_services(
+    series: pd.Series, usage_types: Dict[str, str]
+) -> Dict[str, np.ndarray]:
+    """
+    usage_typeの列から、サービスごとに該当する行のマスクを作成します
+
+    Args:
+        series (pd.Series): usage_typeの列
+        usage_types (Dict[str, str]): サービス名と抽出するusage_typeの辞書
+
+    Returns:
+        Dict[str, np.ndarray]: サービス名ごとの該当する行のマスク
+    """
+    patterns = tuple(usage_types.values())
+    bits = map_categories(series, partial(classify_usage_type, patterns=patterns), 0)
+    return {name: (bits & (1 << i)) != 0 for i, name in enumerate(usage_types)}
+
+
+def filter_negation(
+    df: pd.DataFrame, negation: bool = True, only_negation: bool = False
+) -> pd.DataFrame:
+    """
+    SavingsPlanNegationの有無で使用状況データをフィルタリングします
+
+    Args:
+        df (pd.DataFrame): 使用状況データ
+        negation (bool): SavingsPlanNegationを含めるかどうか
+        only_negation (bool): SavingsPlanNegationのみを抽出するかどうか
+
+    Returns:
+        pd.DataFrame: フィルタリングされた使用状況データ
+    """
+    if not only_negation and negation:
+        return df
+
+    negation_mask = map_categories(df["item_description"], is_negation, False)
+    if only_negation:
+        return df[negation_mask]
+    return df[~negation_mask]
+
+
+def concat_usage(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    使用状況データを結合し、文字列の列を共通のカテゴリを持つカテゴリ型にします
+
+    カテゴリを共通にすることで、結合後もカテゴリ型のまま（整数のコードで）
+    グループ化やソートを行えます。カテゴリは文字列の昇順に並べるため、
+    ソート順は文字列の場合と変わりません。
+
+    Args:
+        frames (List[pd.DataFrame]): 使用状況データのリスト
+
+    Returns:
+        pd.DataFrame: 結合された使用状況データ
+    """
+    for column in CATEGORY_COLUMNS:
+        categories = set()
+        for df in frames:
+            if column in df.columns:
+                categories.update(df[column].dropna().unique())
+        dtype = pd.CategoricalDtype(sorted(categories))
+        frames = [
+            df.astype({column: dtype}) if column in df.columns else df for df in frames
+        ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def merge_usage(
+    frames: List[pd.DataFrame], group_by: List[GroupBy] = None, dropna: bool = True
+):
+    """
+    使用状況データ（部分集計を含む）を結合し、グループ化のキーで合計します
+
+    グループごとの合計は結合順に依存しないため、ファイル単位・チャンク単位の
+    部分集計を何度でも結合できます。
+
+    Args:
+        frames (List[pd.DataFrame]): 使用状況データのリスト
+        group_by (List[GroupBy], optional): グループ化のキー
+        dropna (bool): グループ化のキーが欠損値の行を除外するかどうか
+            （後でより粗いキーで集計し直す場合は、欠損値のグループも残す）
+
+    Returns:
+        pd.DataFrame: 結合された使用状況データ
+    """
+    # データフレームを結合
+    combined_df = concat_usage(frames)
+
+    # 結合したデータに対してグループ化を適用
+    if group_by:
+        combined_df = sum_cost(combined_df, get_group_keys(group_by), dropna)
+    return combined_df
+
+
+def rollup_usage(
+    df: pd.DataFrame, group_by: List[GroupBy]
+) -> List[Tuple[List[str], pd.DataFrame]]:
+    """
+    最も細かい集計結果から、グループ化のキーの全ての組み合わせの集計結果を作成します
+
+    Args:
+        df (pd.DataFrame): group_byの全てのキーで集計済みの使用状況データ
+            （キーが欠損値のグループも残したもの。欠損値は各組み合わせのキーでのみ除外する）
+        group_by (List[GroupBy]): 組み合わせるグループ化のキー
+
+    Returns:
+        List[Tuple[List[str], pd.DataFrame]]: 集計に使用した列と集計結果のリスト
+            （キーの多い順、aws_account_idは常に含む）
+    """
+    levels = []
+    for size in range(len(group_by), -1, -1):
+        for keys in combinations(group_by, size):
+            group_keys = get_group_keys(list(keys))
+            levels.append((group_keys, sum_cost(df, group_keys)))
+    return levels
+
+
+def fold_usage(
+    acc: Optional[pd.DataFrame],
+    df: pd.DataFrame,
+    group_by: List[GroupBy],
+    dropna: bool = True,
+) -> pd.DataFrame:
+    """
+    集計済みの使用状況データに部分集計を加えます
+
+    結合と集計を一件ずつ行うため、保持する行数はグループの数に比例します。
+
+    Args:
+        acc (Optional[pd.DataFrame]): これまでの集計結果（最初はNone）
+        df (pd.DataFrame): 加える部分集計
+        group_by (List[GroupBy]): グループ化のキー
+        dropna (bool): グループ化のキーが欠損値の行を除外するかどうか
+
+    Returns:
+        pd.DataFrame: 集計結果
+    """
+    if acc is None:
+        return df
+    return merge_usage([acc, df], group_by, dropna)
+
+
+def read_usage_data(
     csv_file: str,
-    usage_type: str,
+    usage_types: Dict[str, str],
     negation: bool = True,
+    only_negation: bool = False,
     group_by: List[GroupBy] = None,
-) -> pd.DataFrame:
+    chunksize: int = None,
+    cache_dir: str = None,
+    cache_hash: bool = False,
+    cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+    prefilter: bool = False,
+    engine: Engine = Engine.AUTO,
+    exact: bool = False,
+    dropna: bool = True,
+) -> Optional[Dict[str, pd.DataFrame]]:
     """
-    CSVファイルから指定されたusage_typeの使用状況データを取得します
+    CSVファイルを一度だけ読み込み、usage_typeごとの使用状況データに振り分けます
+
+    チャンク単位で読み込む場合は、チャンクごとにフィルタリングと部分集計を行うため、
+    グループ化を指定したときのメモリ使用量は行数ではなくグループ数に比例します。
 
     Args:
         csv_file (str): CSVファイルのパス
-        usage_type (str): 抽出するusage_type
-        negation (bool, optional): SavingsPlanNegationを含めるかどうか
-        group_by (List[GroupBy], optional): グループ化のキー（usage_type, item_description, month）
+        usage_types (Dict[str, str]): サービス名と抽出するusage_typeの辞書
+        negation (bool): SavingsPlanNegationを含めるかどうか
+        only_negation (bool): SavingsPlanNegationのみを抽出するかどうか
+        group_by (List[GroupBy], optional): グループ化のキー
+        chunksize (int, optional): チャンクの行数（省略時はファイルサイズから自動で決定）
+        cache_dir (str, optional): キャッシュディレクトリ（指定した場合のみキャッシュを使用）
+        cache_hash (bool): キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size (int): キャッシュディレクトリの上限サイズ（MB）
+        since (str, optional): 抽出する最初の月（YYYY-MM形式）
+        until (str, optional): 抽出する最後の月（YYYY-MM形式）
+        accounts (List[str], optional): 抽出するアカウントID
+        prefilter (bool): CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか
+        engine (Engine): CSVの解析エンジン（autoの場合はファイルサイズから決定）
+        exact (bool): costを固定小数点（1e-10 USD単位の整数）で読み込み、整数のまま合計するかどうか
+        dropna (bool): グループ化のキーが欠損値の行を除外するかどうか
 
     Returns:
-        pd.DataFrame: 使用状況データ
+        Dict[str, pd.DataFrame]: サービス名ごとの使用状況データ（該当なしのサービスは含まない）
+            ファイルを読み込めなかった場合はNone
     """
     console.print(f"[bold]ファイル処理中:[/bold] {csv_file}")
 
     try:
-        # pandasでCSVを読み込む
-        df = pd.read_csv(csv_file)
+        # キャッシュには全サービスの行を保存し、どのコマンドからも再利用できるようにする
+        # （Parquetは列指向で読み込めるためキャッシュしない）
+        cache_usage_types = [usage_type for usage_type, _ in SERVICES.values()]
+        use_cache = cache_dir is not None and not is_parquet(csv_file)
+        cached_df = None
+        if use_cache:
+            cached_df = load_cache(
+                cache_dir, csv_file, cache_usage_types, cache_hash, exact
+            )
 
-        # 'usage_type'列に指定された文字列が含まれる行をフィルタリング
-        if "usage_type" in df.columns:
-            filtered_df = df[
-                df["usage_type"].str.contains(usage_type, case=False, na=False)
-            ]
+        if cached_df is not None:
+            chunks = [cached_df]
+            cache_parts = None
+        else:
+            # ヘッダーのみを先に読み込み、必要な列の有無を確認する
+            header = read_header(csv_file)
+            missing_columns = find_missing_columns(header)
+            if missing_columns:
+                console.print(
+                    f"[red]CSVファイルに {', '.join(missing_columns)} 列が見つかりません。[/red]"
+                )
+                return None
+
+            # 必要な列のみを型指定して読み込む
+            # キャッシュする場合は全サービスの行を残すよう、全サービスの条件で絞り込む
+            chunks = iter_usage_csv(
+                csv_file,
+                header,
+                chunksize,
+                cache_usage_types if use_cache else list(usage_types.values()),
+                since,
+                until,
+                accounts,
+                prefilter,
+                engine,
+                exact,
+            )
+            cache_parts = [] if use_cache else None
+
+        # チャンクごとにサービスへ振り分け
+        # （グループ化する場合はチャンクごとの部分集計を順に合算する）
+        parts = {name: [] for name in usage_types}
+        totals = {}
+        for chunk in chunks:
+            if cache_parts is not None:
+                cache_masks = classify_services(
+                    chunk["usage_type"], dict(enumerate(cache_usage_types))
+                )
+                cache_parts.append(
+                    chunk.loc[
+                        np.logical_or.reduce(list(cache_masks.values())), USAGE_COLUMNS
+                    ]
+                )
 
-            # SavingsPlanNegationのフィルタリング
-            if not negation:
-                filtered_df = filtered_df[
-                    ~filtered_df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
+            # 月・アカウントで行を絞り込む（キャッシュには絞り込む前の行を保存する）
+            chunk = filter_period(chunk, since, until, accounts)
+            masks = classify_services(chunk["usage_type"], usage_types)
+            for name in usage_types:
+                filtered_df = chunk.loc[masks[name], USAGE_COLUMNS]
+                filtered_df = filter_negation(filtered_df, negation, only_negation)
+                if filtered_df.empty:
+                    continue
+                if group_by:
+                    totals[name] = fold_usage(
+                        totals.get(name),
+                        merge_usage([filtered_df], group_by, dropna),
+                        group_by,
+                        dropna,
                     )
-                ]
-
-            # 結果があるか確認
-            if filtered_df.empty:
-                console.print("[yellow]該当する行は見つかりませんでした。[/yellow]")
-                return pd.DataFrame()
-
-            # 指定された列のみを選択
-            selected_columns = [
-                "aws_account_id",
-                "month",
-                "usage_type",
-                "item_description",
-                "cost",
-            ]
-            filtered_df = filtered_df[selected_columns]
-
-            # cost列を数値型に変換
-            filtered_df["cost"] = pd.to_numeric(filtered_df["cost"], errors="coerce")
-
-            # グループ化の処理
-            if group_by:
-                group_keys = ["aws_account_id"]
-                if GroupBy.MONTH in group_by:
-                    group_keys.append("month")
-                if GroupBy.USAGE_TYPE in group_by:
-                    group_keys.append("usage_type")
-                if GroupBy.ITEM_DESCRIPTION in group_by:
-                    group_keys.append("item_description")
-
-                filtered_df = (
-                    filtered_df.groupby(group_keys)["cost"].sum().reset_index()
-                )
+                else:
+                    parts[name].append(filtered_df)
+
+        if cache_parts is not None:
+            cache_df = concat_usage(cache_parts)
+            store_cache(
+                cache_dir,
+                csv_file,
+                cache_df,
+                cache_usage_types,
+                cache_hash,
+                cache_max_size,
+                exact,
+            )
 
-            # ソートキーの列が存在する場合のみソート
-            sort_keys = []
-            if "month" in filtered_df.columns:
-                sort_keys.append("month")
-            if "usage_type" in filtered_df.columns:
-                sort_keys.append("usage_type")
-            if "item_description" in filtered_df.columns:
-                sort_keys.append("item_description")
-            if sort_keys:
-                filtered_df = filtered_df.sort_values(sort_keys)
-
-            return filtered_df
-        else:
-            console.print("[red]CSVファイルに 'usage_type' 列が見つかりません。[/red]")
-            return pd.DataFrame()
+        ret = dict(totals)
+        for name, frames in parts.items():
+            if frames:
+                ret[name] = sort_usage(concat_usage(frames))
+
+        if not ret:
+            console.print("[yellow]該当する行は見つかりませんでした。[/yellow]")
+        return ret
 
+    except OverflowError:
+        # 合計が誤った値にならないよう、ファイルを除外せずに処理全体を中止する
+        raise
     except Exception as e:
         console.print(f"[red]エラーが発生しました:[/red] {str(e)}")
-        return pd.DataFrame()
+        return None
 
 
-def display_usage(df: pd.DataFrame, title: str, markdown: bool = False):
+def init_worker(stderr: bool):
+    """
+    ファイルを読み込むプロセスのメッセージの出力先を、親プロセスと同じにします
+
+    spawn・forkserverで起動したプロセスはmainを読み込み直すため、
+    親プロセスで変更したconsoleの設定は引き継がれません。
+
+    Args:
+        stderr (bool): メッセージを標準エラー出力に表示するかどうか
+    """
+    console.stderr = stderr
+
+
+def read_files(
+    csv_files: List[str], read_file: Callable, workers: int = 1
+) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    ファイルごとに読み込み関数を実行し、結果をファイルの指定順に返します
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス
+        read_file (Callable): 1ファイルを読み込む関数
+        workers (int): ファイルを並列で読み込むプロセス数
+
+    Yields:
+        Dict[str, pd.DataFrame]: ファイルごとの読み込み結果（読み込めなかった場合はNone）
+    """
+    # 並列で読み込む場合も結果はファイルの指定順に返すため、出力順は変わらない
+    if workers > 1 and len(csv_files) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(csv_files)),
+            initializer=init_worker,
+            initargs=(console.stderr,),
+        ) as executor:
+            yield from executor.map(read_file, csv_files)
+    else:
+        yield from map(read_file, csv_files)
+
+
+def read_incremental(
+    csv_files: List[str],
+    services: List[str],
+    state_dir: str,
+    workers: int = 1,
+    **read_options,
+) -> Dict[str, pd.DataFrame]:
+    """
+    マニフェストを使用して、追加・変更されたファイルのみを読み込みます
+
+    集計結果はファイル・サービスごとに全てのグループ化のキーで保存しておき、
+    今回指定されたファイル分を取り出して返します。そのため、グループ化のキーや
+    SavingsPlanNegationの指定を変えても保存済みの集計結果を再利用できます。
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス
+        services (List[str]): 抽出するサービス名（SERVICESのキー）
+        state_dir (str): マニフェストと集計結果を保存するディレクトリ
+        workers (int): ファイルを並列で読み込むプロセス数
+        **read_options: read_usage_dataに渡す読み込みのオプション
+
+    Returns:
+        Dict[str, pd.DataFrame]: サービス名ごとの集計結果（全てのグループ化のキーで集計済み）
+    """
+    # costの形式（浮動小数点数・固定小数点）ごとに別の保存先を使い、集計結果を混在させない
+    exact = read_options.get("exact", False)
+    manifest, aggregates = load_manifest(state_dir, exact)
+
+    # 追加・変更されたファイルのみを読み込む
+    sources = [os.path.abspath(csv_file) for csv_file in csv_files]
+    fingerprints = {
+        source: {**file_fingerprint(source), "version": AGGREGATES_VERSION}
+        for source in sources
+    }
+    changed_files = [
+        csv_file
+        for csv_file, source in zip(csv_files, sources)
+        if manifest.get(source) != fingerprints[source]
+    ]
+    console.print(
+        f"[bold]取り込み済み:[/bold] {len(csv_files) - len(changed_files)}件"
+        f" [bold]新規・変更:[/bold] {len(changed_files)}件"
+    )
+
+    read_file = partial(
+        read_usage_data,
+        usage_types={name: usage_type for name, (usage_type, _) in SERVICES.items()},
+        group_by=list(GroupBy),
+        # 保存した集計結果は粗いキーで集計し直すため、欠損値のグループも残す
+        dropna=False,
+        **read_options,
+    )
+    new_aggregates = []
+    for csv_file, usage in zip(
+        changed_files, read_files(changed_files, read_file, workers)
+    ):
+        source = os.path.abspath(csv_file)
+        if usage is None:
+            # 読み込めなかったファイルは取り込み済みにせず、次回も読み込み直す
+            manifest.pop(source, None)
+            continue
+        for name, df in usage.items():
+            new_aggregates.append(df.assign(source=source, service=name))
+        manifest[source] = fingerprints[source]
+
+    # 変更されたファイル・削除されたファイルの集計結果を置き換える
+    removed = [source for source in manifest if not os.path.exists(source)]
+    if changed_files or removed:
+        for source in removed:
+            del manifest[source]
+        if not aggregates.empty:
+            replaced = {os.path.abspath(csv_file) for csv_file in changed_files}
+            aggregates = aggregates[
+                aggregates["source"].isin(manifest)
+                & ~aggregates["source"].isin(replaced)
+            ]
+        aggregates = concat_usage([aggregates, *new_aggregates])
+        save_manifest(state_dir, manifest, aggregates, exact)
+
+    ret = {}
+    for name in services:
+        if aggregates.empty:
+            ret[name] = pd.DataFrame()
+            continue
+        ret[name] = aggregates.loc[
+            aggregates["source"].isin(sources) & (aggregates["service"] == name),
+            USAGE_COLUMNS,
+        ]
+    return ret
+
+
+def extract_usage(
+    csv_files: List[str],
+    services: List[str],
+    negation: bool = True,
+    only_negation: bool = False,
+    group_by: List[GroupBy] = None,
+    chunksize: int = None,
+    workers: int = 1,
+    cache_dir: str = None,
+    cache_hash: bool = False,
+    cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    state_dir: str = None,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+    prefilter: bool = False,
+    engine: Engine = Engine.AUTO,
+    exact: bool = False,
+    dropna: bool = True,
+) -> Dict[str, pd.DataFrame]:
+    """
+    CSVファイルを1ファイルにつき一度だけ読み込み、サービスごとの使用状況データを抽出します
+
+    Args:
+        csv_files (List[str]): CSVファイルのパス（ワイルドカード使用可）
+        services (List[str]): 抽出するサービス名（SERVICESのキー）
+        negation (bool): SavingsPlanNegationを含めるかどうか
+        only_negation (bool): SavingsPlanNegationのみを抽出するかどうか
+        group_by (List[GroupBy], optional): グループ化のキー
+        chunksize (int, optional): チャンクの行数（省略時はファイルサイズから自動で決定）
+        workers (int): ファイルを並列で読み込むプロセス数
+        cache_dir (str, optional): キャッシュディレクトリ（指定した場合のみキャッシュを使用）
+        cache_hash (bool): キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size (int): キャッシュディレクトリの上限サイズ（MB）
+        state_dir (str, optional): マニフェストと集計結果を保存するディレクトリ
+            （グループ化する場合のみ使用し、追加・変更されたファイルのみを読み込む）
+        since (str, optional): 抽出する最初の月（YYYY-MM形式）
+        until (str, optional): 抽出する最後の月（YYYY-MM形式）
+        accounts (List[str], optional): 抽出するアカウントID
+        prefilter (bool): CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか
+        engine (Engine): CSVの解析エンジン（autoの場合はファイルサイズから決定）
+        exact (bool): costを固定小数点（1e-10 USD単位の整数）で読み込み、整数のまま合計するかどうか
+        dropna (bool): グループ化のキーが欠損値の行を除外するかどうか
+            （rollupのように粗いキーで集計し直す場合は、欠損値のグループも残す）
+
+    Returns:
+        Dict[str, pd.DataFrame]: サービス名ごとの使用状況データ（該当なしのサービスは空）
+    """
+    # ワイルドカードを展開してファイルリストを作成
+    expanded_files = expand_csv_files(csv_files)
+    if not expanded_files:
+        console.print("[red]有効なファイルが見つかりませんでした。[/red]")
+        return {}
+
+    # ファイル名に含まれる月・アカウントIDでファイルを絞り込む
+    expanded_files = prune_files(expanded_files, since, until, accounts)
+    if not expanded_files:
+        console.print(
+            "[red]指定された期間・アカウントに該当するファイルが見つかりませんでした。[/red]"
+        )
+        return {}
+
+    # ヘッダーのみを読み込み、使用状況データの列がないファイルを除外する
+    expanded_files = check_files(expanded_files)
+    if not expanded_files:
+        console.print("[red]有効なファイルが見つかりませんでした。[/red]")
+        return {}
+
+    read_options = {
+        "chunksize": chunksize,
+        "cache_dir": cache_dir,
+        "cache_hash": cache_hash,
+        "cache_max_size": cache_max_size,
+        "prefilter": prefilter,
+        "engine": engine,
+        "exact": exact,
+    }
+
+    all_data = {name: [] for name in services}
+    totals = {}
+    if state_dir is not None and group_by:
+        # 保存済みの集計結果にSavingsPlanNegationの指定を適用する
+        usage = read_incremental(
+            expanded_files, services, state_dir, workers, **read_options
+        )
+        for name, df in usage.items():
+            df = filter_period(df, since, until, accounts)
+            df = filter_negation(df, negation, only_negation)
+            if not df.empty:
+                totals[name] = merge_usage([df], group_by, dropna)
+    else:
+        if state_dir is not None:
+            console.print(
+                "[yellow]警告: --state-dir は --group-by を指定した場合のみ使用されます。[/yellow]"
+            )
+
+        read_file = partial(
+            read_usage_data,
+            usage_types={name: SERVICES[name][0] for name in services},
+            negation=negation,
+            only_negation=only_negation,
+            group_by=group_by,
+            since=since,
+            until=until,
+            accounts=accounts,
+            dropna=dropna,
+            **read_options,
+        )
+
+        # 複数のCSVファイルをサービスごとに結合
+        # グループ化する場合はファイルごとの集計結果を読み込んだ順に合算し、
+        # 並列で読み込む場合は次のファイルの読み込み中に合算する
+        for usage in read_files(expanded_files, read_file, workers):
+            if usage is None:
+                continue
+            for name, df in usage.items():
+                if group_by:
+                    totals[name] = fold_usage(totals.get(name), df, group_by, dropna)
+                else:
+                    all_data[name].append(df)
+
+    ret = {}
+    for name in services:
+        if name in totals:
+            ret[name] = totals[name]
+        elif all_data[name]:
+            ret[name] = concat_usage(all_data[name])
+        else:
+            ret[name] = pd.DataFrame()
+
+    return ret
+
+
+def display_usage(
+    df: pd.DataFrame,
+    title: str,
+    markdown: bool = False,
+    max_rows: int = DEFAULT_MAX_ROWS,
+):
     """
     使用状況データを表示します
 
@@ -217,6 +1026,7 @@ def display_usage(df: pd.DataFrame, title: str, markdown: bool = False):
         df (pd.DataFrame): 使用状況データ
         title (str): 表示するタイトル
         markdown (bool): markdown形式で出力するかどうか
+        max_rows (int): 表に表示する最大行数（0の場合は全ての行を表示）
     """
     if df.empty:
         return
@@ -224,34 +1034,225 @@ def display_usage(df: pd.DataFrame, title: str, markdown: bool = False):
     # 結果の表示
     console.print(f"[green]抽出された行数:[/green] {len(df)}")
 
-    # cost列の表示形式を設定
-    if "cost" in df.columns:
-        df["cost"] = df["cost"].apply(lambda x: f"{x:.10f}".rstrip("0").rstrip("."))
+    # cost列は表示する行のみを文字列に変換する（元のデータは数値のまま残す）
+    formatters = {"cost": format_cost}
 
     # テーブルを作成して表示
     if markdown:
-        markdown_table = create_usage_table(df, title, markdown=True)
+        markdown_table = create_usage_table(
+            df, title, markdown=True, max_rows=max_rows, formatters=formatters
+        )
         # markdownのソースを直接出力
         console.print(markdown_table)
     else:
-        table = create_usage_table(df, title)
+        table = create_usage_table(df, title, max_rows=max_rows, formatters=formatters)
         console.print(table)
 
 
+def run_usage(
+    csv_files: List[str],
+    services: List[str],
+    negation: bool = True,
+    only_negation: bool = False,
+    group_by: List[GroupBy] = None,
+    markdown: bool = False,
+    chunksize: int = None,
+    workers: int = 1,
+    cache_dir: str = None,
+    cache_hash: bool = False,
+    cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    state_dir: str = None,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+    prefilter: bool = False,
+    engine: Engine = Engine.AUTO,
+    rollup: bool = False,
+    exact: bool = False,
+    max_rows: int = DEFAULT_MAX_ROWS,
+    output_format: OutputFormat = OutputFormat.TABLE,
+    output: str = None,
+):
+    """
+    サービスごとの使用状況データを抽出して表示します
+
+    Args:
+        csv_files: CSVファイルのパス（複数指定可、ワイルドカード使用可）
+        services: 抽出するサービス名（SERVICESのキー）
+        negation: SavingsPlanNegationを含めるかどうか
+        only_negation: SavingsPlanNegationのみを抽出するかどうか
+        group_by: グループ化のキー
+        markdown: markdown形式で出力するかどうか
+        chunksize: チャンク単位で読み込む行数（省略時はファイルサイズから自動で決定）
+        workers: ファイルを並列で読み込むプロセス数
+        cache_dir: キャッシュディレクトリ（指定した場合のみキャッシュを使用）
+        cache_hash: キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size: キャッシュディレクトリの上限サイズ（MB）
+        state_dir: マニフェストと集計結果を保存するディレクトリ
+        since: 抽出する最初の月（YYYY-MM形式）
+        until: 抽出する最後の月（YYYY-MM形式）
+        accounts: 抽出するアカウントID
+        prefilter: CSVを解析する前に、サービスの条件を含む行のみに絞り込むかどうか
+        engine: CSVの解析エンジン（autoの場合はファイルサイズから決定）
+        rollup: グループ化のキーの全ての組み合わせで集計するかどうか
+            （group_byを指定しない場合は全てのキーを組み合わせる）
+        exact: costを固定小数点（1e-10 USD単位の整数）で読み込み、整数のまま合計するかどうか
+        max_rows: 表に表示する最大行数（0の場合は全ての行を表示）
+        output_format: 出力形式（tableの場合は表を表示し、それ以外は表を作成せずに書き込む）
+        output: 出力先のパス（省略時は標準出力、rollupの場合は組み合わせごとのファイルに書き込む）
+    """
+    if output_format != OutputFormat.TABLE:
+        if output is None and (output_format == OutputFormat.PARQUET or rollup):
+            console.print(
+                "[red]Parquet形式、または --rollup で出力する場合は --output を指定してください。[/red]"
+            )
+            return
+        # 標準出力に書き込む場合は、進捗などのメッセージを標準エラー出力に表示する
+        if output is None:
+            console.stderr = True
+
+    if rollup:
+        # 最も細かい集計を一度だけ作成し、各組み合わせはそこから集計する
+        group_by = list(dict.fromkeys(group_by or list(GroupBy)))
+
+    try:
+        usage = extract_usage(
+            csv_files,
+            services,
+            negation=negation,
+            only_negation=only_negation,
+            group_by=group_by,
+            chunksize=chunksize,
+            workers=workers,
+            cache_dir=cache_dir,
+            cache_hash=cache_hash,
+            cache_max_size=cache_max_size,
+            state_dir=state_dir,
+            since=since,
+            until=until,
+            accounts=accounts,
+            prefilter=prefilter,
+            engine=engine,
+            exact=exact,
+            # 組み合わせごとに集計し直すため、欠損値のグループは各組み合わせで除外する
+            dropna=not rollup,
+        )
+        # 組み合わせごとの集計も、出力を始める前に済ませておく
+        rollups = {}
+        if rollup:
+            rollups = {
+                name: rollup_usage(df, group_by)
+                for name, df in usage.items()
+                if not df.empty
+            }
+    except OverflowError as e:
+        console.print(f"[red]{str(e)}[/red]")
+        raise typer.Exit(code=1)
+    if not usage:
+        return
+
+    if output_format != OutputFormat.TABLE:
+        frames = [(name, usage[name]) for name in services if not usage[name].empty]
+        if not frames:
+            console.print("[red]有効なデータが見つかりませんでした。[/red]")
+            return
+        if not rollup:
+            write_usage(frames, output_format, output)
+            return
+        # 組み合わせごとに別のファイルへ書き込む
+        levels = {}
+        for name, _ in frames:
+            for group_keys, level_df in rollups[name]:
+                levels.setdefault(tuple(group_keys), []).append((name, level_df))
+        for group_keys, level_frames in levels.items():
+            path = level_output_path(output, list(group_keys))
+            write_usage(level_frames, output_format, path)
+            console.print(f"[green]出力しました:[/green] {path}")
+        return
+
+    for name in services:
+        if len(services) > 1:
+            console.print(f"\n[bold]{name}の処理を開始します[/bold]")
+        if usage[name].empty:
+            console.print("[red]有効なデータが見つかりませんでした。[/red]")
+            continue
+        if rollup:
+            for group_keys, df in rollups[name]:
+                title = f"{SERVICES[name][1]}（{', '.join(group_keys)}）"
+                display_usage(df, title, markdown, max_rows)
+            continue
+        display_usage(usage[name], SERVICES[name][1], markdown, max_rows)
+
+
 @app.command()
 def aws_fargate(
     csv_files: List[str] = typer.Argument(
         ...,
-        help="CSVファイルのパス（複数指定可、ワイルドカード使用可）",
+        help="CSV・Parquetファイルのパス（複数指定可、ワイルドカード使用可、Parquetはディレクトリも可）",
     ),
     negation: bool = typer.Option(True, help="SavingsPlanNegationを含めるかどうか"),
     only_negation: bool = typer.Option(
         False, help="SavingsPlanNegationのみを抽出するかどうか"
     ),
-    group_by: List[GroupBy] = typer.Option(
-        None, help="グループ化のキー（usage_type, item_description）"
+    group_by: List[GroupBy] = typer.Option(
+        None, help="グループ化のキー（usage_type, item_description）"
+    ),
+    markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
+    chunksize: int = typer.Option(
+        None,
+        min=1,
+        help="チャンク単位で読み込む行数（指定しない場合はファイルサイズに応じて自動で決定）",
+    ),
+    workers: int = typer.Option(1, min=1, help="ファイルを並列で読み込むプロセス数"),
+    cache_dir: str = typer.Option(
+        None, help="読み込んだデータのキャッシュディレクトリ（指定した場合のみ使用）"
+    ),
+    cache_hash: bool = typer.Option(
+        False, help="キャッシュの照合にファイル内容のハッシュを使用するかどうか"
+    ),
+    cache_max_size: int = typer.Option(
+        DEFAULT_CACHE_MAX_SIZE, min=1, help="キャッシュディレクトリの上限サイズ（MB）"
+    ),
+    state_dir: str = typer.Option(
+        None,
+        help="取り込み済みファイルと集計結果を保存するディレクトリ（--group-by 指定時のみ、追加・変更されたファイルのみを読み込む）",
+    ),
+    since: str = typer.Option(
+        None, callback=validate_month, help="抽出する最初の月（YYYY-MM形式）"
+    ),
+    until: str = typer.Option(
+        None, callback=validate_month, help="抽出する最後の月（YYYY-MM形式）"
+    ),
+    account: List[str] = typer.Option(None, help="抽出するアカウントID（複数指定可）"),
+    prefilter: bool = typer.Option(
+        False,
+        help="CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか",
+    ),
+    engine: Engine = typer.Option(
+        Engine.AUTO,
+        help="CSVの解析エンジン（autoの場合は大きなファイルのみpyarrowで解析）",
+    ),
+    rollup: bool = typer.Option(
+        False,
+        help="グループ化のキーの全ての組み合わせで集計し、組み合わせごとに出力するかどうか",
+    ),
+    exact: bool = typer.Option(
+        False,
+        help="costを固定小数点（1e-10 USD単位の整数）で読み込み、丸め誤差なく合計するかどうか",
+    ),
+    max_rows: int = typer.Option(
+        DEFAULT_MAX_ROWS,
+        min=0,
+        help="表に表示する最大行数（0の場合は全ての行を表示）",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        help="出力形式（table, csv, jsonl, parquet。table以外は表を作成せずに書き込む）",
+    ),
+    output: str = typer.Option(
+        None,
+        help="出力先のパス（省略時は標準出力。parquet・--rollup の場合は必須）",
     ),
-    markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
 ):
     """
     CSVファイルを読み込み、usage_typeにFargateが含まれる行を抽出します
@@ -262,69 +1263,54 @@ def aws_fargate(
         only_negation: SavingsPlanNegationのみを抽出するかどうか
         group_by: グループ化のキー
         markdown: markdown形式で出力するかどうか
+        chunksize: チャンク単位で読み込む行数
+        workers: ファイルを並列で読み込むプロセス数
+        cache_dir: キャッシュディレクトリ
+        cache_hash: キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size: キャッシュディレクトリの上限サイズ（MB）
+        state_dir: 取り込み済みファイルと集計結果を保存するディレクトリ
+        since: 抽出する最初の月（YYYY-MM形式）
+        until: 抽出する最後の月（YYYY-MM形式）
+        account: 抽出するアカウントID
+        prefilter: CSVを解析する前に、サービスの条件を含む行のみに絞り込むかどうか
+        engine: CSVの解析エンジン
+        rollup: グループ化のキーの全ての組み合わせで集計するかどうか
+        exact: costを固定小数点で読み込み、丸め誤差なく合計するかどうか
+        max_rows: 表に表示する最大行数
+        output_format: 出力形式
+        output: 出力先のパス
     """
-    # ワイルドカードを展開してファイルリストを作成
-    expanded_files = []
-    for pattern in csv_files:
-        matched_files = glob.glob(pattern)
-        if not matched_files:
-            console.print(
-                f"[yellow]警告: パターン '{pattern}' に一致するファイルが見つかりませんでした。[/yellow]"
-            )
-        expanded_files.extend(matched_files)
-
-    if not expanded_files:
-        console.print("[red]有効なファイルが見つかりませんでした。[/red]")
-        return
-
-    # 複数のCSVファイルを結合
-    all_data = []
-    for csv_file in expanded_files:
-        # グループ化を適用せずにデータを取得
-        df = get_usage_data(csv_file, "Fargate", True, None)  # negationを常にTrueに設定
-        if not df.empty:
-            # only_negationが指定されている場合は、SavingsPlanNegationのみをフィルタリング
-            if only_negation:
-                df = df[
-                    df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            elif not negation:
-                df = df[
-                    ~df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            all_data.append(df)
-
-    if not all_data:
-        console.print("[red]有効なデータが見つかりませんでした。[/red]")
-        return
-
-    # データフレームを結合
-    combined_df = pd.concat(all_data, ignore_index=True)
-
-    # 結合したデータに対してグループ化を適用
-    if group_by:
-        group_keys = ["aws_account_id"]
-        if GroupBy.MONTH in group_by:
-            group_keys.append("month")
-        if GroupBy.USAGE_TYPE in group_by:
-            group_keys.append("usage_type")
-        if GroupBy.ITEM_DESCRIPTION in group_by:
-            group_keys.append("item_description")
-
-        combined_df = combined_df.groupby(group_keys)["cost"].sum().reset_index()
-
-    display_usage(combined_df, "Fargate使用状況", markdown)
+    run_usage(
+        csv_files,
+        ["Fargate"],
+        negation=negation,
+        only_negation=only_negation,
+        group_by=group_by,
+        markdown=markdown,
+        chunksize=chunksize,
+        workers=workers,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        cache_max_size=cache_max_size,
+        state_dir=state_dir,
+        since=since,
+        until=until,
+        accounts=account,
+        prefilter=prefilter,
+        engine=engine,
+        rollup=rollup,
+        exact=exact,
+        max_rows=max_rows,
+        output_format=output_format,
+        output=output,
+    )
 
 
 @app.command()
 def amazon_ec2(
     csv_files: List[str] = typer.Argument(
         ...,
-        help="CSVファイルのパス（複数指定可、ワイルドカード使用可）",
+        help="CSV・Parquetファイルのパス（複数指定可、ワイルドカード使用可、Parquetはディレクトリも可）",
     ),
     negation: bool = typer.Option(True, help="SavingsPlanNegationを含めるかどうか"),
     only_negation: bool = typer.Option(
@@ -334,6 +1320,61 @@ def amazon_ec2(
         None, help="グループ化のキー（usage_type, item_description）"
     ),
     markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
+    chunksize: int = typer.Option(
+        None,
+        min=1,
+        help="チャンク単位で読み込む行数（指定しない場合はファイルサイズに応じて自動で決定）",
+    ),
+    workers: int = typer.Option(1, min=1, help="ファイルを並列で読み込むプロセス数"),
+    cache_dir: str = typer.Option(
+        None, help="読み込んだデータのキャッシュディレクトリ（指定した場合のみ使用）"
+    ),
+    cache_hash: bool = typer.Option(
+        False, help="キャッシュの照合にファイル内容のハッシュを使用するかどうか"
+    ),
+    cache_max_size: int = typer.Option(
+        DEFAULT_CACHE_MAX_SIZE, min=1, help="キャッシュディレクトリの上限サイズ（MB）"
+    ),
+    state_dir: str = typer.Option(
+        None,
+        help="取り込み済みファイルと集計結果を保存するディレクトリ（--group-by 指定時のみ、追加・変更されたファイルのみを読み込む）",
+    ),
+    since: str = typer.Option(
+        None, callback=validate_month, help="抽出する最初の月（YYYY-MM形式）"
+    ),
+    until: str = typer.Option(
+        None, callback=validate_month, help="抽出する最後の月（YYYY-MM形式）"
+    ),
+    account: List[str] = typer.Option(None, help="抽出するアカウントID（複数指定可）"),
+    prefilter: bool = typer.Option(
+        False,
+        help="CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか",
+    ),
+    engine: Engine = typer.Option(
+        Engine.AUTO,
+        help="CSVの解析エンジン（autoの場合は大きなファイルのみpyarrowで解析）",
+    ),
+    rollup: bool = typer.Option(
+        False,
+        help="グループ化のキーの全ての組み合わせで集計し、組み合わせごとに出力するかどうか",
+    ),
+    exact: bool = typer.Option(
+        False,
+        help="costを固定小数点（1e-10 USD単位の整数）で読み込み、丸め誤差なく合計するかどうか",
+    ),
+    max_rows: int = typer.Option(
+        DEFAULT_MAX_ROWS,
+        min=0,
+        help="表に表示する最大行数（0の場合は全ての行を表示）",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        help="出力形式（table, csv, jsonl, parquet。table以外は表を作成せずに書き込む）",
+    ),
+    output: str = typer.Option(
+        None,
+        help="出力先のパス（省略時は標準出力。parquet・--rollup の場合は必須）",
+    ),
 ):
     """
     CSVファイルを読み込み、usage_typeにBoxが含まれる行を抽出します
@@ -344,69 +1385,54 @@ def amazon_ec2(
         only_negation: SavingsPlanNegationのみを抽出するかどうか
         group_by: グループ化のキー
         markdown: markdown形式で出力するかどうか
+        chunksize: チャンク単位で読み込む行数
+        workers: ファイルを並列で読み込むプロセス数
+        cache_dir: キャッシュディレクトリ
+        cache_hash: キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size: キャッシュディレクトリの上限サイズ（MB）
+        state_dir: 取り込み済みファイルと集計結果を保存するディレクトリ
+        since: 抽出する最初の月（YYYY-MM形式）
+        until: 抽出する最後の月（YYYY-MM形式）
+        account: 抽出するアカウントID
+        prefilter: CSVを解析する前に、サービスの条件を含む行のみに絞り込むかどうか
+        engine: CSVの解析エンジン
+        rollup: グループ化のキーの全ての組み合わせで集計するかどうか
+        exact: costを固定小数点で読み込み、丸め誤差なく合計するかどうか
+        max_rows: 表に表示する最大行数
+        output_format: 出力形式
+        output: 出力先のパス
     """
-    # ワイルドカードを展開してファイルリストを作成
-    expanded_files = []
-    for pattern in csv_files:
-        matched_files = glob.glob(pattern)
-        if not matched_files:
-            console.print(
-                f"[yellow]警告: パターン '{pattern}' に一致するファイルが見つかりませんでした。[/yellow]"
-            )
-        expanded_files.extend(matched_files)
-
-    if not expanded_files:
-        console.print("[red]有効なファイルが見つかりませんでした。[/red]")
-        return
-
-    # 複数のCSVファイルを結合
-    all_data = []
-    for csv_file in expanded_files:
-        # グループ化を適用せずにデータを取得
-        df = get_usage_data(csv_file, "Box", True, None)  # negationを常にTrueに設定
-        if not df.empty:
-            # only_negationが指定されている場合は、SavingsPlanNegationのみをフィルタリング
-            if only_negation:
-                df = df[
-                    df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            elif not negation:
-                df = df[
-                    ~df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            all_data.append(df)
-
-    if not all_data:
-        console.print("[red]有効なデータが見つかりませんでした。[/red]")
-        return
-
-    # データフレームを結合
-    combined_df = pd.concat(all_data, ignore_index=True)
-
-    # 結合したデータに対してグループ化を適用
-    if group_by:
-        group_keys = ["aws_account_id"]
-        if GroupBy.MONTH in group_by:
-            group_keys.append("month")
-        if GroupBy.USAGE_TYPE in group_by:
-            group_keys.append("usage_type")
-        if GroupBy.ITEM_DESCRIPTION in group_by:
-            group_keys.append("item_description")
-
-        combined_df = combined_df.groupby(group_keys)["cost"].sum().reset_index()
-
-    display_usage(combined_df, "EC2使用状況", markdown)
+    run_usage(
+        csv_files,
+        ["EC2"],
+        negation=negation,
+        only_negation=only_negation,
+        group_by=group_by,
+        markdown=markdown,
+        chunksize=chunksize,
+        workers=workers,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        cache_max_size=cache_max_size,
+        state_dir=state_dir,
+        since=since,
+        until=until,
+        accounts=account,
+        prefilter=prefilter,
+        engine=engine,
+        rollup=rollup,
+        exact=exact,
+        max_rows=max_rows,
+        output_format=output_format,
+        output=output,
+    )
 
 
 @app.command()
 def aws_lambda(
     csv_files: List[str] = typer.Argument(
         ...,
-        help="CSVファイルのパス（複数指定可、ワイルドカード使用可）",
+        help="CSV・Parquetファイルのパス（複数指定可、ワイルドカード使用可、Parquetはディレクトリも可）",
     ),
     negation: bool = typer.Option(True, help="SavingsPlanNegationを含めるかどうか"),
     only_negation: bool = typer.Option(
@@ -416,6 +1442,61 @@ def aws_lambda(
         None, help="グループ化のキー（usage_type, item_description）"
     ),
     markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
+    chunksize: int = typer.Option(
+        None,
+        min=1,
+        help="チャンク単位で読み込む行数（指定しない場合はファイルサイズに応じて自動で決定）",
+    ),
+    workers: int = typer.Option(1, min=1, help="ファイルを並列で読み込むプロセス数"),
+    cache_dir: str = typer.Option(
+        None, help="読み込んだデータのキャッシュディレクトリ（指定した場合のみ使用）"
+    ),
+    cache_hash: bool = typer.Option(
+        False, help="キャッシュの照合にファイル内容のハッシュを使用するかどうか"
+    ),
+    cache_max_size: int = typer.Option(
+        DEFAULT_CACHE_MAX_SIZE, min=1, help="キャッシュディレクトリの上限サイズ（MB）"
+    ),
+    state_dir: str = typer.Option(
+        None,
+        help="取り込み済みファイルと集計結果を保存するディレクトリ（--group-by 指定時のみ、追加・変更されたファイルのみを読み込む）",
+    ),
+    since: str = typer.Option(
+        None, callback=validate_month, help="抽出する最初の月（YYYY-MM形式）"
+    ),
+    until: str = typer.Option(
+        None, callback=validate_month, help="抽出する最後の月（YYYY-MM形式）"
+    ),
+    account: List[str] = typer.Option(None, help="抽出するアカウントID（複数指定可）"),
+    prefilter: bool = typer.Option(
+        False,
+        help="CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか",
+    ),
+    engine: Engine = typer.Option(
+        Engine.AUTO,
+        help="CSVの解析エンジン（autoの場合は大きなファイルのみpyarrowで解析）",
+    ),
+    rollup: bool = typer.Option(
+        False,
+        help="グループ化のキーの全ての組み合わせで集計し、組み合わせごとに出力するかどうか",
+    ),
+    exact: bool = typer.Option(
+        False,
+        help="costを固定小数点（1e-10 USD単位の整数）で読み込み、丸め誤差なく合計するかどうか",
+    ),
+    max_rows: int = typer.Option(
+        DEFAULT_MAX_ROWS,
+        min=0,
+        help="表に表示する最大行数（0の場合は全ての行を表示）",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        help="出力形式（table, csv, jsonl, parquet。table以外は表を作成せずに書き込む）",
+    ),
+    output: str = typer.Option(
+        None,
+        help="出力先のパス（省略時は標準出力。parquet・--rollup の場合は必須）",
+    ),
 ):
     """
     CSVファイルを読み込み、usage_typeにLambda-GBが含まれる行を抽出します
@@ -426,71 +1507,54 @@ def aws_lambda(
         only_negation: SavingsPlanNegationのみを抽出するかどうか
         group_by: グループ化のキー
         markdown: markdown形式で出力するかどうか
+        chunksize: チャンク単位で読み込む行数
+        workers: ファイルを並列で読み込むプロセス数
+        cache_dir: キャッシュディレクトリ
+        cache_hash: キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size: キャッシュディレクトリの上限サイズ（MB）
+        state_dir: 取り込み済みファイルと集計結果を保存するディレクトリ
+        since: 抽出する最初の月（YYYY-MM形式）
+        until: 抽出する最後の月（YYYY-MM形式）
+        account: 抽出するアカウントID
+        prefilter: CSVを解析する前に、サービスの条件を含む行のみに絞り込むかどうか
+        engine: CSVの解析エンジン
+        rollup: グループ化のキーの全ての組み合わせで集計するかどうか
+        exact: costを固定小数点で読み込み、丸め誤差なく合計するかどうか
+        max_rows: 表に表示する最大行数
+        output_format: 出力形式
+        output: 出力先のパス
     """
-    # ワイルドカードを展開してファイルリストを作成
-    expanded_files = []
-    for pattern in csv_files:
-        matched_files = glob.glob(pattern)
-        if not matched_files:
-            console.print(
-                f"[yellow]警告: パターン '{pattern}' に一致するファイルが見つかりませんでした。[/yellow]"
-            )
-        expanded_files.extend(matched_files)
-
-    if not expanded_files:
-        console.print("[red]有効なファイルが見つかりませんでした。[/red]")
-        return
-
-    # 複数のCSVファイルを結合
-    all_data = []
-    for csv_file in expanded_files:
-        # グループ化を適用せずにデータを取得
-        df = get_usage_data(
-            csv_file, "Lambda-GB", True, None
-        )  # negationを常にTrueに設定
-        if not df.empty:
-            # only_negationが指定されている場合は、SavingsPlanNegationのみをフィルタリング
-            if only_negation:
-                df = df[
-                    df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            elif not negation:
-                df = df[
-                    ~df["item_description"].str.contains(
-                        "SavingsPlanNegation", case=False, na=False
-                    )
-                ]
-            all_data.append(df)
-
-    if not all_data:
-        console.print("[red]有効なデータが見つかりませんでした。[/red]")
-        return
-
-    # データフレームを結合
-    combined_df = pd.concat(all_data, ignore_index=True)
-
-    # 結合したデータに対してグループ化を適用
-    if group_by:
-        group_keys = ["aws_account_id"]
-        if GroupBy.MONTH in group_by:
-            group_keys.append("month")
-        if GroupBy.USAGE_TYPE in group_by:
-            group_keys.append("usage_type")
-        if GroupBy.ITEM_DESCRIPTION in group_by:
-            group_keys.append("item_description")
-
-        combined_df = combined_df.groupby(group_keys)["cost"].sum().reset_index()
-
-    display_usage(combined_df, "Lambda使用状況", markdown)
+    run_usage(
+        csv_files,
+        ["Lambda"],
+        negation=negation,
+        only_negation=only_negation,
+        group_by=group_by,
+        markdown=markdown,
+        chunksize=chunksize,
+        workers=workers,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        cache_max_size=cache_max_size,
+        state_dir=state_dir,
+        since=since,
+        until=until,
+        accounts=account,
+        prefilter=prefilter,
+        engine=engine,
+        rollup=rollup,
+        exact=exact,
+        max_rows=max_rows,
+        output_format=output_format,
+        output=output,
+    )
 
 
 @app.command()
 def all(
     csv_files: List[str] = typer.Argument(
         ...,
-        help="CSVファイルのパス（複数指定可、ワイルドカード使用可）",
+        help="CSV・Parquetファイルのパス（複数指定可、ワイルドカード使用可、Parquetはディレクトリも可）",
     ),
     negation: bool = typer.Option(True, help="SavingsPlanNegationを含めるかどうか"),
     only_negation: bool = typer.Option(
@@ -500,33 +1564,134 @@ def all(
         None, help="グループ化のキー（usage_type, item_description）"
     ),
     markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
+    chunksize: int = typer.Option(
+        None,
+        min=1,
+        help="チャンク単位で読み込む行数（指定しない場合はファイルサイズに応じて自動で決定）",
+    ),
+    workers: int = typer.Option(1, min=1, help="ファイルを並列で読み込むプロセス数"),
+    cache_dir: str = typer.Option(
+        None, help="読み込んだデータのキャッシュディレクトリ（指定した場合のみ使用）"
+    ),
+    cache_hash: bool = typer.Option(
+        False, help="キャッシュの照合にファイル内容のハッシュを使用するかどうか"
+    ),
+    cache_max_size: int = typer.Option(
+        DEFAULT_CACHE_MAX_SIZE, min=1, help="キャッシュディレクトリの上限サイズ（MB）"
+    ),
+    state_dir: str = typer.Option(
+        None,
+        help="取り込み済みファイルと集計結果を保存するディレクトリ（--group-by 指定時のみ、追加・変更されたファイルのみを読み込む）",
+    ),
+    since: str = typer.Option(
+        None, callback=validate_month, help="抽出する最初の月（YYYY-MM形式）"
+    ),
+    until: str = typer.Option(
+        None, callback=validate_month, help="抽出する最後の月（YYYY-MM形式）"
+    ),
+    account: List[str] = typer.Option(None, help="抽出するアカウントID（複数指定可）"),
+    prefilter: bool = typer.Option(
+        False,
+        help="CSVを解析する前に、サービスの条件を含む行のみにバイト列のまま絞り込むかどうか",
+    ),
+    engine: Engine = typer.Option(
+        Engine.AUTO,
+        help="CSVの解析エンジン（autoの場合は大きなファイルのみpyarrowで解析）",
+    ),
+    rollup: bool = typer.Option(
+        False,
+        help="グループ化のキーの全ての組み合わせで集計し、組み合わせごとに出力するかどうか",
+    ),
+    exact: bool = typer.Option(
+        False,
+        help="costを固定小数点（1e-10 USD単位の整数）で読み込み、丸め誤差なく合計するかどうか",
+    ),
+    max_rows: int = typer.Option(
+        DEFAULT_MAX_ROWS,
+        min=0,
+        help="表に表示する最大行数（0の場合は全ての行を表示）",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        help="出力形式（table, csv, jsonl, parquet。table以外は表を作成せずに書き込む）",
+    ),
+    output: str = typer.Option(
+        None,
+        help="出力先のパス（省略時は標準出力。parquet・--rollup の場合は必須）",
+    ),
 ):
     """
     CSVファイルを読み込み、Fargate、EC2、Lambdaの使用状況を一気に抽出します
 
+    各CSVファイルは一度だけ読み込まれ、サービスごとに振り分けられます。
+
     Args:
         csv_files: CSVファイルのパス（複数指定可、ワイルドカード使用可）
         negation: SavingsPlanNegationを含めるかどうか
         only_negation: SavingsPlanNegationのみを抽出するかどうか
         group_by: グループ化のキー
         markdown: markdown形式で出力するかどうか
+        chunksize: チャンク単位で読み込む行数
+        workers: ファイルを並列で読み込むプロセス数
+        cache_dir: キャッシュディレクトリ
+        cache_hash: キャッシュの照合にファイル内容のハッシュを使用するかどうか
+        cache_max_size: キャッシュディレクトリの上限サイズ（MB）
+        state_dir: 取り込み済みファイルと集計結果を保存するディレクトリ
+        since: 抽出する最初の月（YYYY-MM形式）
+        until: 抽出する最後の月（YYYY-MM形式）
+        account: 抽出するアカウントID
+        prefilter: CSVを解析する前に、サービスの条件を含む行のみに絞り込むかどうか
+        engine: CSVの解析エンジン
+        rollup: グループ化のキーの全ての組み合わせで集計するかどうか
+        exact: costを固定小数点で読み込み、丸め誤差なく合計するかどうか
+        max_rows: 表に表示する最大行数
+        output_format: 出力形式
+        output: 出力先のパス
     """
-    # 各サービスの処理を実行
-    services = [
-        ("Fargate", aws_fargate),
-        ("EC2", amazon_ec2),
-        ("Lambda", aws_lambda),
-    ]
+    run_usage(
+        csv_files,
+        list(SERVICES),
+        negation=negation,
+        only_negation=only_negation,
+        group_by=group_by,
+        markdown=markdown,
+        chunksize=chunksize,
+        workers=workers,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        cache_max_size=cache_max_size,
+        state_dir=state_dir,
+        since=since,
+        until=until,
+        accounts=account,
+        prefilter=prefilter,
+        engine=engine,
+        rollup=rollup,
+        exact=exact,
+        max_rows=max_rows,
+        output_format=output_format,
+        output=output,
+    )
 
-    for service_name, command_func in services:
-        console.print(f"\n[bold]{service_name}の処理を開始します[/bold]")
-        command_func(
-            csv_files=csv_files,
-            negation=negation,
-            only_negation=only_negation,
-            group_by=group_by,
-            markdown=markdown,
+
+def use_pricing_snapshot(path: Optional[str]) -> bool:
+    """
+    料金データを読み込むスナップショットを設定します
+
+    Args:
+        path (str, optional): スナップショットのパス（Noneの場合は通信して取得する）
+
+    Returns:
+        bool: スナップショットを設定できた場合（指定がない場合を含む）はTrue
+    """
+    try:
+        configure_pricing_snapshot(path)
+    except (OSError, ValueError) as e:
+        console.print(
+            f"[red]スナップショットの読み込み中にエラーが発生しました:[/red] {str(e)}"
         )
+        return False
+    return True
 
 
 @app.command()
@@ -548,6 +1713,29 @@ def amazon_ec2_discount_rate(
         None,
         help="EC2インスタンスタイプ（指定しない場合は全インスタンスタイプの割引率を表示）",
     ),
+    pricing_cache: bool = typer.Option(
+        True, help="料金データのキャッシュを使用するかどうか"
+    ),
+    pricing_cache_dir: str = typer.Option(
+        DEFAULT_PRICING_CACHE_DIR, help="料金データのキャッシュディレクトリ"
+    ),
+    pricing_cache_ttl: int = typer.Option(
+        DEFAULT_PRICING_CACHE_TTL,
+        min=0,
+        help="料金データのキャッシュを再検証せずに使用する秒数",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_READ_TIMEOUT, min=0.1, help="料金データの読み込みのタイムアウト（秒）"
+    ),
+    retries: int = typer.Option(
+        DEFAULT_RETRIES,
+        min=0,
+        help="料金データの取得に失敗した場合（接続エラー・5xx・429）に再試行する回数",
+    ),
+    pricing_snapshot: str = typer.Option(
+        None,
+        help="料金データを読み込むスナップショットのパス（指定した場合は通信しない）",
+    ),
 ):
     """
     EC2 Savings Plansの割引率を取得する
@@ -559,7 +1747,19 @@ def amazon_ec2_discount_rate(
         operating_system: オペレーティングシステム
         tenancy: テナンシー
         instance_type: EC2インスタンスタイプ（オプション）
+        pricing_cache: 料金データのキャッシュを使用するかどうか
+        pricing_cache_dir: 料金データのキャッシュディレクトリ
+        pricing_cache_ttl: 料金データのキャッシュを再検証せずに使用する秒数
+        timeout: 料金データの読み込みのタイムアウト（秒）
+        retries: 料金データの取得に失敗した場合に再試行する回数
+        pricing_snapshot: 料金データを読み込むスナップショットのパス
     """
+    configure_pricing_cache(
+        pricing_cache_dir if pricing_cache else None, pricing_cache_ttl
+    )
+    configure_http(read_timeout=timeout, retries=retries)
+    if not use_pricing_snapshot(pricing_snapshot):
+        return
     discount_rate = get_amazon_ec2_discount_rate(
         instance_type=instance_type,
         term=term,
@@ -600,6 +1800,29 @@ def aws_fargate_discount_rate(
     ),
     memory: bool = typer.Option(False, "--memory", help="メモリの割引率を表示"),
     cpu: bool = typer.Option(False, "--cpu", help="CPUの割引率を表示"),
+    pricing_cache: bool = typer.Option(
+        True, help="料金データのキャッシュを使用するかどうか"
+    ),
+    pricing_cache_dir: str = typer.Option(
+        DEFAULT_PRICING_CACHE_DIR, help="料金データのキャッシュディレクトリ"
+    ),
+    pricing_cache_ttl: int = typer.Option(
+        DEFAULT_PRICING_CACHE_TTL,
+        min=0,
+        help="料金データのキャッシュを再検証せずに使用する秒数",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_READ_TIMEOUT, min=0.1, help="料金データの読み込みのタイムアウト（秒）"
+    ),
+    retries: int = typer.Option(
+        DEFAULT_RETRIES,
+        min=0,
+        help="料金データの取得に失敗した場合（接続エラー・5xx・429）に再試行する回数",
+    ),
+    pricing_snapshot: str = typer.Option(
+        None,
+        help="料金データを読み込むスナップショットのパス（指定した場合は通信しない）",
+    ),
 ):
     """
     Fargate Savings Plansの割引率を取得する
@@ -612,7 +1835,19 @@ def aws_fargate_discount_rate(
         cpu_architecture: CPUアーキテクチャ
         memory: メモリの割引率のみを表示
         cpu: CPUの割引率のみを表示
+        pricing_cache: 料金データのキャッシュを使用するかどうか
+        pricing_cache_dir: 料金データのキャッシュディレクトリ
+        pricing_cache_ttl: 料金データのキャッシュを再検証せずに使用する秒数
+        timeout: 料金データの読み込みのタイムアウト（秒）
+        retries: 料金データの取得に失敗した場合に再試行する回数
+        pricing_snapshot: 料金データを読み込むスナップショットのパス
     """
+    configure_pricing_cache(
+        pricing_cache_dir if pricing_cache else None, pricing_cache_ttl
+    )
+    configure_http(read_timeout=timeout, retries=retries)
+    if not use_pricing_snapshot(pricing_snapshot):
+        return
     discount_rate = get_aws_fargate_discount_rate(
         term=term,
         payment_option=payment_option,
@@ -650,8 +1885,37 @@ def aws_lambda_discount_rate(
         AwsLambdaRegion.ASIA_PACIFIC_TOKYO,
         help="リージョン",
     ),
+    pricing_cache: bool = typer.Option(
+        True, help="料金データのキャッシュを使用するかどうか"
+    ),
+    pricing_cache_dir: str = typer.Option(
+        DEFAULT_PRICING_CACHE_DIR, help="料金データのキャッシュディレクトリ"
+    ),
+    pricing_cache_ttl: int = typer.Option(
+        DEFAULT_PRICING_CACHE_TTL,
+        min=0,
+        help="料金データのキャッシュを再検証せずに使用する秒数",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_READ_TIMEOUT, min=0.1, help="料金データの読み込みのタイムアウト（秒）"
+    ),
+    retries: int = typer.Option(
+        DEFAULT_RETRIES,
+        min=0,
+        help="料金データの取得に失敗した場合（接続エラー・5xx・429）に再試行する回数",
+    ),
+    pricing_snapshot: str = typer.Option(
+        None,
+        help="料金データを読み込むスナップショットのパス（指定した場合は通信しない）",
+    ),
 ) -> None:
     """Lambda Savings Plansの割引率を取得する"""
+    configure_pricing_cache(
+        pricing_cache_dir if pricing_cache else None, pricing_cache_ttl
+    )
+    configure_http(read_timeout=timeout, retries=retries)
+    if not use_pricing_snapshot(pricing_snapshot):
+        return
     discount_rate = get_aws_lambda_discount_rate(
         term=term,
         payment_option=payment_option,
@@ -669,5 +1933,232 @@ def aws_lambda_discount_rate(
         console.print("[red]割引率の取得に失敗しました。[/red]")
 
 
+@app.command()
+def discount_rate_matrix(
+    service: PricingService = typer.Argument(
+        ..., help="割引率を取得するサービス（ec2, fargate, lambda）"
+    ),
+    term: List[str] = typer.Option(
+        None, help="契約期間（複数指定可、指定しない場合は全て）"
+    ),
+    payment_option: List[str] = typer.Option(
+        None, help="支払いオプション（複数指定可、指定しない場合は全て）"
+    ),
+    region: List[str] = typer.Option(
+        None, help="リージョン（複数指定可、指定しない場合は全て）"
+    ),
+    operating_system: List[str] = typer.Option(
+        None,
+        help="オペレーティングシステム（ec2・fargateのみ、複数指定可、指定しない場合は全て）",
+    ),
+    tenancy: List[str] = typer.Option(
+        None, help="テナンシー（ec2のみ、複数指定可、指定しない場合は全て）"
+    ),
+    cpu_architecture: List[str] = typer.Option(
+        None,
+        help="CPUアーキテクチャ（fargateのみ、複数指定可、指定しない場合は全て）",
+    ),
+    instance_type: str = typer.Option(
+        None,
+        "--instance-type",
+        "-i",
+        help="EC2インスタンスタイプ（ec2のみ、指定しない場合は全インスタンスタイプ）",
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MATRIX_WORKERS,
+        min=1,
+        help="割引率を並列で取得するスレッド数（同じホストへの同時接続数の上限も兼ねる）",
+    ),
+    markdown: bool = typer.Option(False, help="markdown形式で出力するかどうか"),
+    max_rows: int = typer.Option(
+        DEFAULT_MAX_ROWS,
+        min=0,
+        help="表に表示する最大行数（0の場合は全ての行を表示）",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        help="出力形式（table, csv, jsonl, parquet。table以外は表を作成せずに書き込む）",
+    ),
+    output: str = typer.Option(
+        None, help="出力先のパス（省略時は標準出力。parquetの場合は必須）"
+    ),
+    pricing_cache: bool = typer.Option(
+        True, help="料金データのキャッシュを使用するかどうか"
+    ),
+    pricing_cache_dir: str = typer.Option(
+        DEFAULT_PRICING_CACHE_DIR, help="料金データのキャッシュディレクトリ"
+    ),
+    pricing_cache_ttl: int = typer.Option(
+        DEFAULT_PRICING_CACHE_TTL,
+        min=0,
+        help="料金データのキャッシュを再検証せずに使用する秒数",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_READ_TIMEOUT, min=0.1, help="料金データの読み込みのタイムアウト（秒）"
+    ),
+    retries: int = typer.Option(
+        DEFAULT_RETRIES,
+        min=0,
+        help="料金データの取得に失敗した場合（接続エラー・5xx・429）に再試行する回数",
+    ),
+    pricing_snapshot: str = typer.Option(
+        None,
+        help="料金データを読み込むスナップショットのパス（指定した場合は通信しない）",
+    ),
+):
+    """
+    契約期間・支払いオプション・リージョンなどの全ての組み合わせの割引率を並列で取得する
+
+    Args:
+        service: 割引率を取得するサービス
+        term: 契約期間
+        payment_option: 支払いオプション
+        region: リージョン
+        operating_system: オペレーティングシステム
+        tenancy: テナンシー
+        cpu_architecture: CPUアーキテクチャ
+        instance_type: EC2インスタンスタイプ（オプション）
+        workers: 割引率を並列で取得するスレッド数
+        markdown: markdown形式で出力するかどうか
+        max_rows: 表に表示する最大行数
+        output_format: 出力形式
+        output: 出力先のパス
+        pricing_cache: 料金データのキャッシュを使用するかどうか
+        pricing_cache_dir: 料金データのキャッシュディレクトリ
+        pricing_cache_ttl: 料金データのキャッシュを再検証せずに使用する秒数
+        timeout: 料金データの読み込みのタイムアウト（秒）
+        retries: 料金データの取得に失敗した場合に再試行する回数
+        pricing_snapshot: 料金データを読み込むスナップショットのパス
+    """
+    if output_format == OutputFormat.PARQUET and output is None:
+        console.print(
+            "[red]Parquet形式で出力する場合は --output を指定してください。[/red]"
+        )
+        return
+    if instance_type and service != PricingService.EC2:
+        console.print("[red]--instance-type は ec2 の場合のみ指定できます。[/red]")
+        return
+
+    try:
+        combinations = build_combinations(
+            service,
+            {
+                "term": term,
+                "payment_option": payment_option,
+                "region": region,
+                "operating_system": operating_system,
+                "tenancy": tenancy,
+                "cpu_architecture": cpu_architecture,
+            },
+        )
+    except ValueError as e:
+        console.print(f"[red]{str(e)}[/red]")
+        return
+
+    # 標準出力に書き込む場合は、進捗などのメッセージを標準エラー出力に表示する
+    if output_format != OutputFormat.TABLE and output is None:
+        console.stderr = True
+
+    configure_pricing_cache(
+        pricing_cache_dir if pricing_cache else None, pricing_cache_ttl
+    )
+    configure_http(read_timeout=timeout, retries=retries, pool_size=workers)
+    if not use_pricing_snapshot(pricing_snapshot):
+        return
+    options = {"instance_type": instance_type} if instance_type else {}
+
+    console.print(f"[bold]{len(combinations)}件の組み合わせの割引率を取得します[/bold]")
+    df, failed = get_discount_rate_matrix(service, combinations, workers, **options)
+    if failed:
+        console.print(
+            f"[yellow]割引率を取得できなかった組み合わせ:[/yellow] {failed}件"
+        )
+    if df.empty:
+        console.print("[red]割引率の取得に失敗しました。[/red]")
+        return
+
+    if output_format != OutputFormat.TABLE:
+        write_usage([(service.value, df)], output_format, output)
+        return
+
+    console.print(f"[green]取得した割引率の数:[/green] {len(df)}")
+    table = create_usage_table(
+        df,
+        f"{service.value}の割引率",
+        markdown=markdown,
+        max_rows=max_rows,
+        formatters={"discount_rate": lambda values: values.map("{:.4f}".format)},
+    )
+    console.print(table)
+
+
+@snapshot_app.command("create")
+def create_pricing_snapshot(
+    path: str = typer.Argument(
+        ..., help="作成するスナップショットのパス（ZIPファイル）"
+    ),
+    service: List[PricingService] = typer.Option(
+        None, help="料金データを取得するサービス（複数指定可、指定しない場合は全て）"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MATRIX_WORKERS,
+        min=1,
+        help="料金データを並列で取得するスレッド数（同じホストへの同時接続数の上限も兼ねる）",
+    ),
+    pricing_cache: bool = typer.Option(
+        True, help="料金データのキャッシュを使用するかどうか"
+    ),
+    pricing_cache_dir: str = typer.Option(
+        DEFAULT_PRICING_CACHE_DIR, help="料金データのキャッシュディレクトリ"
+    ),
+    pricing_cache_ttl: int = typer.Option(
+        DEFAULT_PRICING_CACHE_TTL,
+        min=0,
+        help="料金データのキャッシュを再検証せずに使用する秒数",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_READ_TIMEOUT, min=0.1, help="料金データの読み込みのタイムアウト（秒）"
+    ),
+    retries: int = typer.Option(
+        DEFAULT_RETRIES,
+        min=0,
+        help="料金データの取得に失敗した場合（接続エラー・5xx・429）に再試行する回数",
+    ),
+):
+    """
+    割引率の計算に使用する料金データを全て取得し、1つのスナップショットにまとめる
+
+    Args:
+        path: 作成するスナップショットのパス
+        service: 料金データを取得するサービス
+        workers: 料金データを並列で取得するスレッド数
+        pricing_cache: 料金データのキャッシュを使用するかどうか
+        pricing_cache_dir: 料金データのキャッシュディレクトリ
+        pricing_cache_ttl: 料金データのキャッシュを再検証せずに使用する秒数
+        timeout: 料金データの読み込みのタイムアウト（秒）
+        retries: 料金データの取得に失敗した場合に再試行する回数
+    """
+    configure_pricing_cache(
+        pricing_cache_dir if pricing_cache else None, pricing_cache_ttl
+    )
+    configure_http(read_timeout=timeout, retries=retries, pool_size=workers)
+
+    services = list(dict.fromkeys(service)) if service else list(PricingService)
+    urls = [url for s in services for url in get_index_urls(s)]
+    console.print(f"[bold]{len(urls)}件の料金データを取得します[/bold]")
+    try:
+        manifest = write_snapshot(path, crawl_pricing(urls, workers))
+    except requests.RequestException as e:
+        console.print(f"[red]料金データの取得中にエラーが発生しました:[/red] {str(e)}")
+        return
+
+    console.print(f"[green]スナップショットを作成しました:[/green] {path}")
+    console.print(f"[blue]料金データの数:[/blue] {manifest['entries']}")
+    if manifest["missing"]:
+        console.print(
+            f"[yellow]料金データが存在しなかった組み合わせ:[/yellow] {len(manifest['missing'])}件"
+        )
+
+
 if __name__ == "__main__":
     app()
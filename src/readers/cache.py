@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+# キャッシュの形式を変更した場合に古いエントリを無効にするためのバージョン
+CACHE_VERSION = 1
+
+# キャッシュディレクトリの上限サイズ（MB）の既定値
+DEFAULT_CACHE_MAX_SIZE = 1024
+
+
+def _entry_path(cache_dir: str, csv_file: str) -> str:
+    name = hashlib.sha256(os.path.abspath(csv_file).encode()).hexdigest()
+    return os.path.join(cache_dir, name)
+
+
+def _content_hash(csv_file: str) -> str:
+    digest = hashlib.sha256()
+    with open(csv_file, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _fingerprint(
+    csv_file: str, usage_types: List[str], use_hash: bool, exact: bool
+) -> dict:
+    stat = os.stat(csv_file)
+    return {
+        "version": CACHE_VERSION,
+        "path": os.path.abspath(csv_file),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _content_hash(csv_file) if use_hash else None,
+        "usage_types": sorted(usage_types),
+        "exact": exact,
+    }
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def load_cache(
+    cache_dir: str,
+    csv_file: str,
+    usage_types: List[str],
+    use_hash: bool = False,
+    exact: bool = False,
+) -> Optional[pd.DataFrame]:
+    """
+    キャッシュ済みの使用状況データを読み込みます
+
+    元のファイルのパス・サイズ・更新日時（use_hashの場合は内容のハッシュも）や
+    costの形式がキャッシュ作成時と異なる場合は、古いエントリを削除してNoneを返します。
+
+    Args:
+        cache_dir (str): キャッシュディレクトリ
+        csv_file (str): 元のCSVファイルのパス
+        usage_types (List[str]): キャッシュに含まれるusage_typeの条件
+        use_hash (bool): ファイル内容のハッシュも照合するかどうか
+        exact (bool): costを固定小数点（1e-10 USD単位の整数）で保存したキャッシュかどうか
+
+    Returns:
+        Optional[pd.DataFrame]: キャッシュ済みの使用状況データ（キャッシュがない場合はNone）
+    """
+    entry = _entry_path(cache_dir, csv_file)
+    try:
+        with open(entry + ".json", encoding="utf-8") as f:
+            fingerprint = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if fingerprint != _fingerprint(csv_file, usage_types, use_hash, exact):
+        _remove(entry + ".json")
+        _remove(entry + ".parquet")
+        return None
+
+    try:
+        df = pd.read_parquet(entry + ".parquet")
+    except Exception:
+        return None
+
+    # 最近使用したエントリが削除されにくいよう、更新日時を更新する
+    os.utime(entry + ".parquet")
+    return df
+
+
+def store_cache(
+    cache_dir: str,
+    csv_file: str,
+    df: pd.DataFrame,
+    usage_types: List[str],
+    use_hash: bool = False,
+    max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    exact: bool = False,
+):
+    """
+    使用状況データをキャッシュに保存し、上限サイズを超えた分を古い順に削除します
+
+    Args:
+        cache_dir (str): キャッシュディレクトリ
+        csv_file (str): 元のCSVファイルのパス
+        df (pd.DataFrame): フィルタリング・列の絞り込み済みの使用状況データ
+        usage_types (List[str]): キャッシュに含まれるusage_typeの条件
+        use_hash (bool): ファイル内容のハッシュも照合するかどうか
+        max_size (int): キャッシュディレクトリの上限サイズ（MB）
+        exact (bool): costが固定小数点（1e-10 USD単位の整数）かどうか
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = _entry_path(cache_dir, csv_file)
+    fingerprint = _fingerprint(csv_file, usage_types, use_hash, exact)
+
+    # 書き込み途中のファイルを読み込まないよう、一時ファイルから置き換える
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, entry + ".parquet")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f)
+    os.replace(tmp, entry + ".json")
+
+    evict_cache(cache_dir, max_size)
+
+
+def evict_cache(cache_dir: str, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+    """
+    キャッシュディレクトリが上限サイズを超えている場合、使用日時の古いエントリから削除します
+
+    Args:
+        cache_dir (str): キャッシュディレクトリ
+        max_size (int): キャッシュディレクトリの上限サイズ（MB）
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".parquet"):
+            continue
+        try:
+            stat = os.stat(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name[: -len(".parquet")]))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_size * 1024 * 1024:
+            break
+        _remove(os.path.join(cache_dir, name + ".json"))
+        _remove(os.path.join(cache_dir, name + ".parquet"))
+        total -= size
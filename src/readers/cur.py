@@ -0,0 +1,499 @@
+import importlib.util
+import os
+from contextlib import nullcontext
+from enum import Enum
+from typing import Dict, Iterator, List
+
+import pandas as pd
+
+from readers.fixed_point import to_fixed_cost
+from readers.parquet import is_parquet, iter_usage_parquet, read_parquet_header
+from readers.prefilter import open_binary, open_prefiltered
+
+# 使用状況データとして抽出する列
+USAGE_COLUMNS = [
+    "aws_account_id",
+    "month",
+    "usage_type",
+    "item_description",
+    "cost",
+]
+
+# 抽出する列の型（アカウントIDは先頭の0を保持するため文字列で読み込む）
+USAGE_DTYPES = {
+    "aws_account_id": str,
+    "month": str,
+    "usage_type": "category",
+    "item_description": "category",
+    "cost": "float64",
+}
+
+# 使用状況データの列として読み込むCURの列名（先頭から順に探す）
+COLUMN_ALIASES = {
+    "aws_account_id": [
+        "aws_account_id",
+        "lineItem/UsageAccountId",
+        "line_item_usage_account_id",
+    ],
+    "month": [
+        "month",
+        "billing_period",
+        "bill/BillingPeriodStartDate",
+        "bill_billing_period_start_date",
+    ],
+    "usage_type": [
+        "usage_type",
+        "lineItem/UsageType",
+        "line_item_usage_type",
+    ],
+    "item_description": [
+        "item_description",
+        "lineItem/LineItemDescription",
+        "line_item_line_item_description",
+    ],
+    "cost": [
+        "cost",
+        "lineItem/UnblendedCost",
+        "line_item_unblended_cost",
+    ],
+}
+
+# このサイズを超えるファイルはチャンク単位で読み込む
+AUTO_CHUNK_THRESHOLD = 256 * 1024 * 1024
+
+# 自動でチャンク単位の読み込みを行う場合の行数
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# 圧縮されたCSVファイルとして読み込む拡張子（gzip, bz2, zstd, zip）
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".zst", ".zip")
+
+# engine=autoの場合に、このサイズを超えるファイルはpyarrowで解析する
+PYARROW_THRESHOLD = 64 * 1024 * 1024
+
+
+class Engine(str, Enum):
+    """CSVの解析エンジン"""
+
+    C = "c"
+    PYARROW = "pyarrow"
+    AUTO = "auto"
+
+
+# pandas.read_csv（Cエンジン）が既定で欠損値として扱う文字列
+PANDAS_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def resolve_engine(csv_file: str, engine: Engine = Engine.AUTO) -> Engine:
+    """
+    CSVファイルの解析に使用するエンジンを決定します
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        engine (Engine): 指定されたエンジン（autoの場合はファイルサイズから決定）
+
+    Returns:
+        Engine: 使用するエンジン（cまたはpyarrow）
+    """
+    if engine != Engine.AUTO:
+        return engine
+    # pyarrowがインストールされていない場合はcエンジンを使用する
+    if importlib.util.find_spec("pyarrow") is None:
+        return Engine.C
+    if os.path.getsize(csv_file) > PYARROW_THRESHOLD:
+        return Engine.PYARROW
+    return Engine.C
+
+
+def is_compressed(csv_file: str) -> bool:
+    """
+    圧縮されたCSVファイルかどうかを拡張子から判定します
+
+    Args:
+        csv_file (str): CSVファイルのパス
+
+    Returns:
+        bool: 圧縮されている場合はTrue
+    """
+    return csv_file.lower().endswith(COMPRESSION_SUFFIXES)
+
+
+def read_header(csv_file: str) -> List[str]:
+    """
+    CSVファイルのヘッダー行のみを読み込み、列名のリストを返します
+
+    Args:
+        csv_file (str): CSVファイル（Parquetファイル・ディレクトリも可）のパス
+
+    Returns:
+        List[str]: 列名のリスト
+    """
+    if is_parquet(csv_file):
+        return read_parquet_header(csv_file)
+    return pd.read_csv(csv_file, nrows=0).columns.tolist()
+
+
+def resolve_columns(header: List[str]) -> Dict[str, str]:
+    """
+    ヘッダーから、使用状況データの列に対応するファイル上の列名を探します
+
+    Args:
+        header (List[str]): 列名のリスト
+
+    Returns:
+        Dict[str, str]: 使用状況データの列名とファイル上の列名の対応（見つかった列のみ）
+    """
+    columns = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in header:
+                columns[column] = alias
+                break
+    return columns
+
+
+def find_missing_columns(header: List[str]) -> List[str]:
+    """
+    ヘッダーに見つからない使用状況データの列を返します
+
+    Args:
+        header (List[str]): 列名のリスト
+
+    Returns:
+        List[str]: 見つからない使用状況データの列名のリスト
+    """
+    columns = resolve_columns(header)
+    return [column for column in USAGE_COLUMNS if column not in columns]
+
+
+def normalize_columns(df: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+    """
+    ファイル上の列名を使用状況データの列名に変換し、月をYYYY-MM形式に揃えます
+
+    Args:
+        df (pd.DataFrame): ファイル上の列名で読み込んだデータ
+        columns (Dict[str, str]): 使用状況データの列名とファイル上の列名の対応
+
+    Returns:
+        pd.DataFrame: 使用状況データの列名に変換されたデータ
+    """
+    renames = {actual: column for column, actual in columns.items() if actual != column}
+    if renames:
+        df = df.rename(columns=renames)
+    # 請求期間の開始日時（2024-12-01T00:00:00Z など）は年月のみにする
+    if columns.get("month", "month") != "month":
+        df["month"] = df["month"].astype(str).str[:7]
+    return df
+
+
+def to_cost(values: pd.Series, exact: bool = False) -> pd.Series:
+    """
+    cost列を数値に変換します
+
+    Args:
+        values (pd.Series): cost列（文字列または数値）
+        exact (bool): 固定小数点（1e-10 USD単位の整数）に変換するかどうか
+
+    Returns:
+        pd.Series: 数値のcost列（数値として解釈できない値は欠損値）
+    """
+    if exact:
+        return to_fixed_cost(values)
+    return pd.to_numeric(values, errors="coerce")
+
+
+def open_csv(csv_file: str, prefilter: List[str] = None, decompress: bool = False):
+    """
+    pd.read_csvに渡す読み込み元を返します（withで使用します）
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        prefilter (List[str], optional): 解析前に行を絞り込むパターン（省略時は絞り込まない）
+        decompress (bool): 圧縮されたファイルを展開しながら読み込むファイルオブジェクトを返すかどうか
+            （ファイルパスから展開できない読み込み処理の場合に指定します）
+
+    Returns:
+        読み込み元（ファイルパスまたはファイルオブジェクト）のコンテキストマネージャー
+    """
+    if prefilter:
+        return open_prefiltered(csv_file, prefilter)
+    if decompress and is_compressed(csv_file):
+        return open_binary(csv_file)
+    return nullcontext(csv_file)
+
+
+def read_usage_csv(
+    csv_file: str,
+    header: List[str] = None,
+    prefilter: List[str] = None,
+    exact: bool = False,
+) -> pd.DataFrame:
+    """
+    CSVファイルから使用状況データに必要な列のみを型指定して読み込みます
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        header (List[str], optional): 読み込み済みのヘッダー（省略時はファイルから読み込む）
+        prefilter (List[str], optional): 解析前に行を絞り込むパターン（省略時は絞り込まない）
+        exact (bool): cost列を固定小数点（1e-10 USD単位の整数）で読み込むかどうか
+
+    Returns:
+        pd.DataFrame: 必要な列のみの使用状況データ
+
+    Note:
+        - cost列に数値以外の値が含まれる場合は、その値をNaNとして読み込みます
+    """
+    if header is None:
+        header = read_header(csv_file)
+    columns = resolve_columns(header)
+    usecols = list(columns.values())
+    dtype = {actual: USAGE_DTYPES[column] for column, actual in columns.items()}
+    cost = columns.get("cost")
+    # 固定小数点で読み込む場合は、浮動小数点数を経由しないよう文字列で読み込む
+    if exact and cost is not None:
+        dtype[cost] = str
+
+    try:
+        with open_csv(csv_file, prefilter) as source:
+            df = pd.read_csv(source, usecols=usecols, dtype=dtype)
+    except ValueError:
+        # cost列が数値として解釈できない場合は文字列で読み込んでから変換する
+        dtype.pop(cost, None)
+        with open_csv(csv_file, prefilter) as source:
+            df = pd.read_csv(source, usecols=usecols, dtype=dtype)
+    if cost is not None and df[cost].dtype == object:
+        df[cost] = to_cost(df[cost], exact)
+    return normalize_columns(df, columns)
+
+
+def _pyarrow_convert_options(columns: Dict[str, str], cost_as_number: bool = True):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # アカウントIDの先頭の0を保持するため、cost以外は文字列として読み込む
+    column_types = {actual: pa.string() for actual in columns.values()}
+    if cost_as_number and "cost" in columns:
+        column_types[columns["cost"]] = pa.float64()
+    # Cエンジンと同じ値を欠損値として読み込み、どちらのエンジンでも同じ結果にする
+    return pa_csv.ConvertOptions(
+        include_columns=list(columns.values()),
+        column_types=column_types,
+        null_values=PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+    )
+
+
+def _pyarrow_to_frame(table, columns: Dict[str, str]) -> pd.DataFrame:
+    df = normalize_columns(table.to_pandas(), columns)
+    df = df.astype({column: USAGE_DTYPES[column] for column in columns})
+    return df
+
+
+def read_usage_pyarrow_csv(
+    csv_file: str,
+    columns: Dict[str, str],
+    prefilter: List[str] = None,
+    exact: bool = False,
+) -> pd.DataFrame:
+    """
+    pyarrowのマルチスレッドCSVリーダーで、使用状況データに必要な列のみを読み込みます
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        columns (Dict[str, str]): 使用状況データの列名とファイル上の列名の対応
+        prefilter (List[str], optional): 解析前に行を絞り込むパターン（省略時は絞り込まない）
+        exact (bool): cost列を固定小数点（1e-10 USD単位の整数）で読み込むかどうか
+
+    Returns:
+        pd.DataFrame: 必要な列のみの使用状況データ
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # 固定小数点で読み込む場合は、浮動小数点数を経由しないよう文字列で読み込む
+    try:
+        with open_csv(csv_file, prefilter, decompress=True) as source:
+            table = pa_csv.read_csv(
+                source,
+                convert_options=_pyarrow_convert_options(
+                    columns, cost_as_number=not exact
+                ),
+            )
+    except pa.ArrowInvalid:
+        # cost列が数値として解釈できない場合は文字列で読み込んでから変換する
+        with open_csv(csv_file, prefilter, decompress=True) as source:
+            table = pa_csv.read_csv(
+                source,
+                convert_options=_pyarrow_convert_options(columns, cost_as_number=False),
+            )
+
+    columns = dict(columns)
+    cost = columns.pop("cost", None)
+    df = _pyarrow_to_frame(table.drop_columns(cost) if cost else table, columns)
+    if cost is not None:
+        df["cost"] = to_cost(table[cost].to_pandas(), exact)
+    return df
+
+
+def iter_usage_pyarrow_csv(
+    csv_file: str,
+    columns: Dict[str, str],
+    chunksize: int,
+    prefilter: List[str] = None,
+    exact: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    pyarrowのストリーミングCSVリーダーで、使用状況データに必要な列をチャンク単位で読み込みます
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        columns (Dict[str, str]): 使用状況データの列名とファイル上の列名の対応
+        chunksize (int): チャンクの行数
+        prefilter (List[str], optional): 解析前に行を絞り込むパターン（省略時は絞り込まない）
+        exact (bool): cost列を固定小数点（1e-10 USD単位の整数）で読み込むかどうか
+
+    Yields:
+        pd.DataFrame: 必要な列のみの使用状況データ（チャンク）
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # 途中のチャンクで読み直すことはできないため、cost列は文字列で読み込んでから変換する
+    convert_options = _pyarrow_convert_options(columns, cost_as_number=False)
+    columns = dict(columns)
+    cost = columns.pop("cost", None)
+
+    def to_frame(batches: list) -> pd.DataFrame:
+        table = pa.Table.from_batches(batches)
+        chunk = _pyarrow_to_frame(table, columns)
+        if cost is not None:
+            chunk["cost"] = to_cost(table[cost].to_pandas(), exact)
+        return chunk
+
+    with open_csv(csv_file, prefilter, decompress=True) as source:
+        batches = []
+        rows = 0
+        for batch in pa_csv.open_csv(source, convert_options=convert_options):
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= chunksize:
+                yield to_frame(batches)
+                batches = []
+                rows = 0
+        if batches:
+            yield to_frame(batches)
+
+
+def iter_usage_csv(
+    csv_file: str,
+    header: List[str] = None,
+    chunksize: int = None,
+    usage_types: List[str] = None,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+    prefilter: bool = False,
+    engine: Engine = Engine.AUTO,
+    exact: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    CSVファイルから使用状況データに必要な列をチャンク単位で読み込みます
+
+    Args:
+        csv_file (str): CSVファイル（Parquetファイル・ディレクトリも可）のパス
+        header (List[str], optional): 読み込み済みのヘッダー（省略時はファイルから読み込む）
+        chunksize (int, optional): チャンクの行数（省略時はファイルサイズから自動で決定）
+        usage_types (List[str], optional): usage_typeに含まれる文字列（Parquetの場合は読み込み時に絞り込む）
+        since (str, optional): 読み込む最初の月（Parquetの場合は読み込み時に絞り込む）
+        until (str, optional): 読み込む最後の月（Parquetの場合は読み込み時に絞り込む）
+        accounts (List[str], optional): 読み込むアカウントID（Parquetの場合は読み込み時に絞り込む）
+        prefilter (bool): CSVを解析する前に、usage_typesを含む行のみにバイト列のまま絞り込むかどうか
+        engine (Engine): CSVの解析エンジン（autoの場合はファイルサイズから決定）
+        exact (bool): cost列を固定小数点（1e-10 USD単位の整数）で読み込むかどうか
+
+    Yields:
+        pd.DataFrame: 必要な列のみの使用状況データ（チャンク）
+
+    Note:
+        - チャンクに分割しない場合は、ファイル全体を1つのチャンクとして返します
+        - チャンク単位で読み込む場合、cost列はチャンクごとに数値へ変換します
+        - 圧縮されたファイルは展開しながらチャンク単位で読み込みます
+        - CSVの場合、usage_types・月・アカウントによる絞り込みは呼び出し側で行います
+          （prefilterで絞り込んだ場合も、列の値による判定は呼び出し側で行う必要があります）
+    """
+    if header is None:
+        header = read_header(csv_file)
+    columns = resolve_columns(header)
+
+    if is_parquet(csv_file):
+        dtype = {column: USAGE_DTYPES[column] for column in columns}
+        dtype.pop("month", None)
+        for chunk in iter_usage_parquet(
+            csv_file, columns, dtype, usage_types, chunksize, since, until, accounts
+        ):
+            chunk = normalize_columns(chunk, columns)
+            if exact and "cost" in chunk.columns:
+                chunk["cost"] = to_cost(chunk["cost"], exact)
+            yield chunk
+        return
+
+    # 圧縮されたファイルは展開後のサイズが分からないため、常にチャンク単位で読み込む
+    if chunksize is None and (
+        is_compressed(csv_file) or os.path.getsize(csv_file) > AUTO_CHUNK_THRESHOLD
+    ):
+        chunksize = DEFAULT_CHUNKSIZE
+    prefilter = usage_types if prefilter else None
+    engine = resolve_engine(csv_file, engine)
+    if not chunksize:
+        if engine == Engine.PYARROW:
+            yield read_usage_pyarrow_csv(csv_file, columns, prefilter, exact)
+        else:
+            yield read_usage_csv(csv_file, header, prefilter, exact)
+        return
+
+    # pd.read_csvのpyarrowエンジンはチャンク単位の読み込みに対応していないため、
+    # pyarrowのストリーミングCSVリーダーを使用する
+    if engine == Engine.PYARROW:
+        yield from iter_usage_pyarrow_csv(
+            csv_file, columns, chunksize, prefilter, exact
+        )
+        return
+
+    usecols = list(columns.values())
+    # 途中のチャンクで読み直すことはできないため、cost列の型は指定しない
+    dtype = {
+        actual: USAGE_DTYPES[column]
+        for column, actual in columns.items()
+        if column != "cost"
+    }
+    # 固定小数点で読み込む場合は、浮動小数点数を経由しないよう文字列で読み込む
+    if exact and "cost" in columns:
+        dtype[columns["cost"]] = str
+
+    with open_csv(csv_file, prefilter) as source:
+        reader = pd.read_csv(source, usecols=usecols, dtype=dtype, chunksize=chunksize)
+        with reader:
+            for chunk in reader:
+                chunk = normalize_columns(chunk, columns)
+                if "cost" in chunk.columns:
+                    chunk["cost"] = to_cost(chunk["cost"], exact)
+                yield chunk
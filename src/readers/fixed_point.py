@@ -0,0 +1,208 @@
+import importlib.util
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_numeric_dtype
+
+# 固定小数点のcostの単位（1e-10 USD。CURの金額は小数点以下10桁まで）
+COST_DIGITS = 10
+COST_SCALE = 10**COST_DIGITS
+
+# 整数演算のみで変換できるcostの文字列（整数部は int64 に収まる桁数まで）
+_SIMPLE_COST_PATTERN = rf"^\s*([+-]?)(\d{{0,8}})(?:\.(\d{{0,{COST_DIGITS}}}))?\s*$"
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# 整数部をint64として扱える浮動小数点数の絶対値の上限
+_INT64_LIMIT = float(2**63)
+
+# 小数部を丸める際に、丸めの境界（.5）に近いとみなす幅（乗算の誤差の上限より十分大きい値）
+_TIE_MARGIN = 1e-5
+
+# 固定小数点のcostで合計できる絶対値の上限（int64の範囲。約9.2億USD）
+COST_SUM_LIMIT = float(2**63)
+
+
+def _parse_decimal(value: str):
+    try:
+        scaled = (Decimal(value.strip()) * COST_SCALE).to_integral_value(
+            ROUND_HALF_EVEN
+        )
+    except (InvalidOperation, AttributeError):
+        return pd.NA
+    if not scaled.is_finite() or not _INT64_MIN <= scaled <= _INT64_MAX:
+        return pd.NA
+    return int(scaled)
+
+
+def to_fixed_cost(values: pd.Series) -> pd.Series:
+    """
+    costの列を固定小数点（1e-10 USD単位の整数）に変換します
+
+    文字列は浮動小数点数を経由せずに変換するため、合計は丸め誤差なく求められます。
+
+    Args:
+        values (pd.Series): costの列（文字列または数値）
+
+    Returns:
+        pd.Series: 1e-10 USD単位の整数（Int64型、数値として解釈できない値は欠損値）
+
+    Note:
+        - 数値の列（Parquetなど）は浮動小数点数から丸めるため、元の値の精度に依存します
+        - 指数表記や小数点以下11桁以上の値は、Decimalで変換して偶数丸めします
+    """
+    if is_numeric_dtype(values.dtype):
+        return (values.astype("float64") * COST_SCALE).round().astype("Int64")
+
+    text = values.astype("string")
+    parts = text.str.extract(_SIMPLE_COST_PATTERN)
+    simple = parts[1].notna() & ((parts[1] != "") | parts[2].fillna("").ne(""))
+    simple = simple.to_numpy(dtype=bool, na_value=False)
+
+    # Int64の列に部分的に代入すると浮動小数点数を経由するため、
+    # int64の配列と欠損値のマスクに値を埋めてから Int64 の列にする
+    scaled = np.zeros(len(values), dtype="int64")
+    missing = np.ones(len(values), dtype=bool)
+    if simple.any():
+        integer = parts.loc[simple, 1].replace("", "0").to_numpy(dtype="int64")
+        fraction = (
+            parts.loc[simple, 2]
+            .fillna("")
+            .str.ljust(COST_DIGITS, "0")
+            .to_numpy(dtype="int64")
+        )
+        negative = (parts.loc[simple, 0] == "-").to_numpy(dtype=bool)
+        simple_scaled = integer * COST_SCALE + fraction
+        scaled[simple] = np.where(negative, -simple_scaled, simple_scaled)
+        missing[simple] = False
+
+    # 指数表記などは該当する行のみDecimalで変換する
+    rest = ~simple & (text.notna() & text.str.strip().ne("")).to_numpy(
+        dtype=bool, na_value=False
+    )
+    if rest.any():
+        parsed = text[rest].map(_parse_decimal)
+        valid = parsed.notna().to_numpy()
+        positions = np.flatnonzero(rest)[valid]
+        scaled[positions] = np.array(parsed[valid].tolist(), dtype="int64")
+        missing[positions] = False
+    return pd.Series(pd.arrays.IntegerArray(scaled, missing), index=values.index)
+
+
+def sum_cost(df: pd.DataFrame, keys: List[str], dropna: bool = True) -> pd.DataFrame:
+    """
+    グループごとにcostを合計します
+
+    固定小数点（Int64）のcostは、int64の加算が範囲を超えると符号が反転して
+    誤った合計になるため、浮動小数点数でも合計して範囲を確認します。
+
+    Args:
+        df (pd.DataFrame): 使用状況データ
+        keys (List[str]): グループ化の列
+        dropna (bool): グループ化の列が欠損値の行を除外するかどうか
+
+    Returns:
+        pd.DataFrame: グループ化の列とcostの列
+
+    Raises:
+        OverflowError: 固定小数点のcostの合計が表せる範囲（±約9.2億USD）を超えた場合
+    """
+    sums = df.groupby(keys, observed=True, dropna=dropna)["cost"].sum()
+    if is_integer_dtype(sums.dtype):
+        approx = (
+            df.assign(cost=df["cost"].astype("float64"))
+            .groupby(keys, observed=True, dropna=dropna)["cost"]
+            .sum()
+        )
+        if (approx.abs() >= COST_SUM_LIMIT).any():
+            raise OverflowError(
+                "costの合計が --exact で表せる範囲"
+                f"（±{COST_SUM_LIMIT / COST_SCALE:,.0f} USD）を超えました。"
+                "--exact を指定せずに実行してください。"
+            )
+    return sums.reset_index()
+
+
+def _join_cost(
+    negative: np.ndarray, integer: np.ndarray, fraction: np.ndarray
+) -> pd.Series:
+    # 小数部は10桁に0埋めしてから末尾の0を除き、小数部がない場合は小数点も付けない
+    if importlib.util.find_spec("pyarrow") is None:
+        fraction = (
+            pd.Series(fraction).astype(str).str.zfill(COST_DIGITS).str.rstrip("0")
+        )
+        point = np.where(fraction.to_numpy() != "", ".", "")
+        sign = np.where(negative, "-", "")
+        return sign + pd.Series(integer).astype(str) + point + fraction
+
+    # pyarrowがある場合は文字列の操作もpyarrowの関数でまとめて行う
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    fraction = pc.utf8_rtrim(
+        pc.utf8_lpad(pc.cast(pa.array(fraction), pa.string()), COST_DIGITS, "0"),
+        "0",
+    )
+    point = pc.if_else(pc.equal(fraction, ""), "", ".")
+    sign = pc.if_else(pa.array(negative), "-", "")
+    integer = pc.cast(pa.array(integer), pa.string())
+    return pc.binary_join_element_wise(sign, integer, point, fraction, "").to_pandas()
+
+
+def format_cost(values: pd.Series) -> pd.Series:
+    """
+    costの列を、小数点以下10桁に丸めて末尾の0を除いた文字列の列にします
+
+    列全体をまとめて変換し、元の列は変更しません。
+    浮動小数点数は整数部と小数部に分けてから小数部を丸め、丸めの境界に近い値と
+    int64に収まらない値のみ f"{x:.10f}" で変換するため、
+    f"{x:.10f}" から末尾の0を除いた文字列と同じになります。
+
+    Args:
+        values (pd.Series): costの列（浮動小数点数、または固定小数点のInt64）
+
+    Returns:
+        pd.Series: 文字列の列（元の列と同じインデックス、欠損値は "nan"）
+    """
+    if is_integer_dtype(values.dtype):
+        missing = values.isna().to_numpy()
+        scaled = values.fillna(0).to_numpy(dtype="int64")
+        negative = scaled < 0
+        integer, fraction = np.divmod(np.abs(scaled), COST_SCALE)
+        fallback = np.zeros(len(values), dtype=bool)
+    else:
+        signed = values.to_numpy(dtype="float64")
+        missing = ~np.isfinite(signed)
+        costs = np.where(missing, 0.0, signed)
+        negative = np.signbit(costs)
+        costs = np.abs(costs)
+        # int64に収まらない値は、整数部・小数部に分けずに文字列に変換する
+        fallback = costs >= _INT64_LIMIT
+        costs = np.where(fallback, 0.0, costs)
+        integer = np.floor(costs)
+        # 整数部を引く計算は誤差がなく、乗算の誤差は COST_SCALE * 2**-53 未満のため、
+        # 丸めの境界（.5）から離れた値は np.rint で f"{x:.10f}" と同じ向きに丸められる
+        scaled = (costs - integer) * COST_SCALE
+        fraction = np.rint(scaled)
+        fallback |= np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_MARGIN
+        # 小数部を丸めた結果が1になる場合は整数部に繰り上げる
+        carry = fraction >= COST_SCALE
+        integer = (integer + carry).astype("int64")
+        fraction = np.where(carry, 0, fraction).astype("int64")
+
+    formatted = _join_cost(negative, integer, fraction)
+    formatted.index = values.index
+    # 丸めの境界に近い値・int64に収まらない値は、1件ずつ f"{x:.10f}" で変換する
+    fallback &= ~missing
+    if fallback.any():
+        formatted[fallback] = [
+            f"{x:.10f}".rstrip("0").rstrip(".") for x in signed[fallback]
+        ]
+    if missing.any():
+        formatted[missing] = values[missing].map(
+            lambda x: "nan" if pd.isna(x) else str(float(x))
+        )
+    return formatted
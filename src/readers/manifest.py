@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+from typing import Dict, Tuple, Union
+
+import pandas as pd
+
+MANIFEST_FILE = "manifest.json"
+AGGREGATES_FILE = "aggregates.parquet"
+
+# costを固定小数点で集計した場合の保存先（浮動小数点数の集計結果と混在させない）
+EXACT_MANIFEST_FILE = "manifest.exact.json"
+EXACT_AGGREGATES_FILE = "aggregates.exact.parquet"
+
+# 集計結果の形式のバージョン（変更した場合は保存済みのファイルを全て読み込み直す）
+# 2: グループ化のキーが欠損値の行も保存する
+AGGREGATES_VERSION = 2
+
+
+def file_fingerprint(csv_file: str) -> Dict[str, Union[int, str]]:
+    """
+    ファイルが変更されたかどうかを判定するためのサイズと更新日時を返します
+
+    ディレクトリ（Parquetのデータセット）の場合は、含まれる全てのファイルの
+    パス・サイズ・更新日時から求めます。
+
+    Args:
+        csv_file (str): CSVファイル、またはParquetのディレクトリのパス
+
+    Returns:
+        Dict[str, Union[int, str]]: ファイルのサイズと更新日時（ナノ秒）
+            （ディレクトリの場合は合計サイズ・最新の更新日時と、ファイルごとの値のハッシュ）
+    """
+    if not os.path.isdir(csv_file):
+        stat = os.stat(csv_file)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    # ディレクトリ自体の更新日時はファイルを上書きしても変わらないため、ファイルごとに調べる
+    digest = hashlib.sha256()
+    size = 0
+    mtime_ns = 0
+    for root, dirs, files in os.walk(csv_file):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            size += stat.st_size
+            mtime_ns = max(mtime_ns, stat.st_mtime_ns)
+            relpath = os.path.relpath(path, csv_file)
+            digest.update(f"{relpath}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return {"size": size, "mtime_ns": mtime_ns, "files": digest.hexdigest()}
+
+
+def _state_files(exact: bool) -> Tuple[str, str]:
+    if exact:
+        return EXACT_MANIFEST_FILE, EXACT_AGGREGATES_FILE
+    return MANIFEST_FILE, AGGREGATES_FILE
+
+
+def load_manifest(
+    state_dir: str, exact: bool = False
+) -> Tuple[Dict[str, dict], pd.DataFrame]:
+    """
+    取り込み済みファイルのマニフェストと集計結果を読み込みます
+
+    Args:
+        state_dir (str): マニフェストと集計結果を保存するディレクトリ
+        exact (bool): costを固定小数点で集計した保存先を読み込むかどうか
+
+    Returns:
+        Tuple[Dict[str, dict], pd.DataFrame]: ファイルの絶対パスごとのフィンガープリントと、
+            ファイル（source）・サービス（service）ごとの集計結果
+    """
+    manifest_file, aggregates_file = _state_files(exact)
+    try:
+        with open(os.path.join(state_dir, manifest_file), encoding="utf-8") as f:
+            manifest = json.load(f)
+        aggregates = pd.read_parquet(os.path.join(state_dir, aggregates_file))
+    except (FileNotFoundError, ValueError):
+        return {}, pd.DataFrame()
+    return manifest, aggregates
+
+
+def save_manifest(
+    state_dir: str,
+    manifest: Dict[str, dict],
+    aggregates: pd.DataFrame,
+    exact: bool = False,
+):
+    """
+    取り込み済みファイルのマニフェストと集計結果を保存します
+
+    Args:
+        state_dir (str): マニフェストと集計結果を保存するディレクトリ
+        manifest (Dict[str, dict]): ファイルの絶対パスごとのフィンガープリント
+        aggregates (pd.DataFrame): ファイル・サービスごとの集計結果
+        exact (bool): costを固定小数点で集計した保存先に保存するかどうか
+    """
+    os.makedirs(state_dir, exist_ok=True)
+    manifest_file, aggregates_file = _state_files(exact)
+
+    # 集計結果を先に保存し、マニフェストだけが更新された状態にならないようにする
+    path = os.path.join(state_dir, aggregates_file)
+    aggregates.to_parquet(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+
+    path = os.path.join(state_dir, manifest_file)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
@@ -0,0 +1,117 @@
+import os
+from typing import Dict, Iterator, List
+
+import pandas as pd
+
+PARQUET_SUFFIX = ".parquet"
+
+# 年月（YYYY-MM）の文字列として保存されている月の列
+STRING_MONTH_COLUMNS = ("month", "billing_period")
+
+
+def is_parquet(path: str) -> bool:
+    """
+    Parquetファイル、またはParquetファイルを含むディレクトリかどうかを判定します
+
+    Args:
+        path (str): ファイルまたはディレクトリのパス
+
+    Returns:
+        bool: Parquetとして読み込む場合はTrue
+    """
+    return path.lower().endswith(PARQUET_SUFFIX) or os.path.isdir(path)
+
+
+def _dataset(path: str):
+    # pyarrowはParquetを読み込む場合のみ必要なため、ここでインポートする
+    try:
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquetファイルの読み込みには pyarrow が必要です（pip install pyarrow）"
+        ) from e
+
+    return ds.dataset(path, format="parquet", partitioning="hive")
+
+
+def read_parquet_header(path: str) -> List[str]:
+    """
+    Parquetファイル（ディレクトリ）のスキーマから列名のリストを返します
+
+    Args:
+        path (str): Parquetファイルまたはディレクトリのパス
+
+    Returns:
+        List[str]: 列名のリスト
+    """
+    return _dataset(path).schema.names
+
+
+def iter_usage_parquet(
+    path: str,
+    columns: Dict[str, str],
+    dtype: Dict[str, str],
+    usage_types: List[str] = None,
+    chunksize: int = None,
+    since: str = None,
+    until: str = None,
+    accounts: List[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Parquetファイル（ディレクトリ）から使用状況データを読み込みます
+
+    列の選択とusage_type・月・アカウントの条件はParquetの読み込み時に適用されるため、
+    不要な列や条件に一致しない行はDataFrameに変換されません（月の条件は行グループの
+    統計情報による読み飛ばしにも使用されます）。
+
+    Args:
+        path (str): Parquetファイルまたはディレクトリのパス
+        columns (Dict[str, str]): 読み込む列（使用状況データの列名とファイル上の列名の対応）
+        dtype (Dict[str, str]): 使用状況データの列ごとの型
+        usage_types (List[str], optional): usage_typeに含まれる文字列（いずれかに一致する行のみ読み込む）
+        chunksize (int, optional): チャンクの行数（省略時は一括で読み込む）
+        since (str, optional): 読み込む最初の月（YYYY-MM形式）
+        until (str, optional): 読み込む最後の月（YYYY-MM形式）
+        accounts (List[str], optional): 読み込むアカウントID
+
+    Yields:
+        pd.DataFrame: 使用状況データの列名に変換された使用状況データ（チャンク）
+
+    Note:
+        - 月の条件は、月の列が文字列（month, billing_period）の場合のみ読み込み時に適用します
+    """
+    import pyarrow.compute as pc
+
+    dataset = _dataset(path)
+
+    # usage_typeの条件（大文字小文字を区別しない部分一致）を読み込み時に適用する
+    row_filter = None
+    for usage_type in usage_types or []:
+        expression = pc.match_substring_regex(
+            pc.field(columns["usage_type"]), usage_type, ignore_case=True
+        )
+        row_filter = expression if row_filter is None else row_filter | expression
+
+    # 月・アカウントの条件を追加する
+    conditions = []
+    if columns.get("month") in STRING_MONTH_COLUMNS:
+        if since:
+            conditions.append(pc.field(columns["month"]) >= since)
+        if until:
+            conditions.append(pc.field(columns["month"]) <= until)
+    if accounts and "aws_account_id" in columns:
+        conditions.append(pc.field(columns["aws_account_id"]).isin(accounts))
+    for condition in conditions:
+        row_filter = condition if row_filter is None else row_filter & condition
+
+    names = list(columns.values())
+    if chunksize:
+        batches = dataset.to_batches(
+            columns=names, filter=row_filter, batch_size=chunksize
+        )
+    else:
+        batches = [dataset.to_table(columns=names, filter=row_filter)]
+
+    renames = {actual: column for column, actual in columns.items()}
+    for batch in batches:
+        yield batch.to_pandas().rename(columns=renames).astype(dtype)
@@ -0,0 +1,118 @@
+import bz2
+import gzip
+import io
+import re
+import zipfile
+from typing import BinaryIO, List
+
+# 一度に読み込むバイト数
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def open_binary(csv_file: str) -> BinaryIO:
+    """
+    CSVファイルをバイナリモードで開きます（圧縮されたファイルは展開しながら読み込みます）
+
+    Args:
+        csv_file (str): CSVファイルのパス
+
+    Returns:
+        BinaryIO: ファイルオブジェクト
+    """
+    lower = csv_file.lower()
+    if lower.endswith(".gz"):
+        return gzip.open(csv_file, "rb")
+    if lower.endswith(".bz2"):
+        return bz2.open(csv_file, "rb")
+    if lower.endswith(".zip"):
+        archive = zipfile.ZipFile(csv_file)
+        return archive.open(archive.namelist()[0])
+    if lower.endswith(".zst"):
+        # zstandardは.zstファイルを読み込む場合のみ必要なため、ここでインポートする
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(open(csv_file, "rb"))
+    return open(csv_file, "rb")
+
+
+class PrefilteredReader(io.RawIOBase):
+    """
+    ヘッダー行と、指定されたパターンを含む行のみを返すファイルオブジェクト
+
+    CSVとして解析する前にバイト列のままパターンを検索し、該当しない行を読み飛ばします。
+    パターンは行全体に対して検索するため、該当した行は解析後に改めて列の値で判定する必要があります。
+    """
+
+    def __init__(self, raw: BinaryIO, patterns: List[str]):
+        self._raw = raw
+        self._pattern = re.compile(
+            "|".join(patterns).encode("utf-8"), flags=re.IGNORECASE
+        )
+        self._buffer = b""
+        self._offset = 0
+        self._rest = b""
+        self._header = True
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+    def readinto(self, b) -> int:
+        while self._offset >= len(self._buffer) and not self._eof:
+            self._fill()
+        size = min(len(b), len(self._buffer) - self._offset)
+        b[:size] = self._buffer[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+    def _fill(self):
+        block = self._raw.read(BLOCK_SIZE)
+        if not block:
+            self._eof = True
+            block, self._rest = self._rest, b""
+        else:
+            # 最後の改行以降は次のブロックと合わせて処理する
+            block = self._rest + block
+            end = block.rfind(b"\n") + 1
+            block, self._rest = block[:end], block[end:]
+
+        header = b""
+        if self._header and block:
+            end = block.find(b"\n") + 1 or len(block)
+            header, block = block[:end], block[end:]
+            self._header = False
+
+        self._buffer = header + self._filter(block)
+        self._offset = 0
+
+    def _filter(self, block: bytes) -> bytes:
+        lines = []
+        line_end = 0
+        for match in self._pattern.finditer(block):
+            if match.start() < line_end:
+                continue
+            line_start = block.rfind(b"\n", 0, match.start()) + 1
+            line_end = block.find(b"\n", match.end()) + 1 or len(block)
+            lines.append(block[line_start:line_end])
+        return b"".join(lines)
+
+
+def open_prefiltered(csv_file: str, patterns: List[str]) -> io.BufferedReader:
+    """
+    ヘッダー行と、いずれかのパターンを含む行のみを読み込むファイルオブジェクトを返します
+
+    Args:
+        csv_file (str): CSVファイルのパス
+        patterns (List[str]): 行に含まれるパターン（正規表現、大文字小文字を区別しない）
+
+    Returns:
+        io.BufferedReader: ファイルオブジェクト
+
+    Note:
+        - 値に改行を含む行（引用符で囲まれた改行）は正しく絞り込めません
+    """
+    return io.BufferedReader(PrefilteredReader(open_binary(csv_file), patterns))
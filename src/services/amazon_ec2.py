@@ -1,14 +1,51 @@
 from typing import Dict
 from urllib.parse import quote
 
-import requests
 from rich.console import Console
 
 from enums.amazon_ec2 import OperatingSystem, PaymentOption, Region, Tenancy, Term
+from services.json_stream import iter_object_items
+from services.pricing import fetch_pricing_json, iter_pricing
 
 console = Console()
 
 
+# EC2のSavings Plans料金データのURL
+BASE_URL = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-ec2"
+
+
+def get_index_url(
+    term: Term,
+    payment_option: PaymentOption,
+    region: Region,
+    operating_system: OperatingSystem,
+    tenancy: Tenancy,
+) -> str:
+    """
+    割引率の計算に使用する料金データ（index.json）のURLを返します
+
+    Args:
+        term (Term): 契約期間（1年または3年）
+        payment_option (PaymentOption): 支払いオプション（全額前払い、一部前払い、前払いなし）
+        region (Region): AWSリージョン
+        operating_system (OperatingSystem): オペレーティングシステム
+        tenancy (Tenancy): テナンシー（共有、専有、ホスト）
+
+    Returns:
+        str: 料金データのURL
+    """
+    path_parameters = "/".join(
+        [
+            quote(term.value),
+            quote(payment_option.value),
+            quote(region.value),
+            quote(operating_system.value),
+            quote(tenancy.value),
+        ]
+    )
+    return f"{BASE_URL}/{path_parameters}/index.json"
+
+
 def get_discount_rate(
     term: Term = Term.ONE_YEAR,
     payment_option: PaymentOption = PaymentOption.NO_UPFRONT,
@@ -42,28 +79,21 @@ def get_discount_rate(
         - 割引率は、1 - (Savings Plans価格 / 通常価格) で計算されます
         - インスタンスタイプが見つからない場合はNoneを返します
         - APIリクエストに失敗した場合はNoneを返します
+        - インスタンスタイプを指定した場合は、料金データを読み込みながら絞り込みます
     """
     # APIのURLを構築
-    base_url = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-ec2"
-    path_parameters = "/".join(
-        [
-            quote(term.value),
-            quote(payment_option.value),
-            quote(region.value),
-            quote(operating_system.value),
-            quote(tenancy.value),
-        ]
-    )
-    url = f"{base_url}/{path_parameters}/index.json"
+    url = get_index_url(term, payment_option, region, operating_system, tenancy)
 
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        if instance_type:
+            # インスタンスタイプを指定した場合は、料金データ全体を辞書にせず読み込みながら絞り込む
+            entries = iter_object_items(iter_pricing(url), ("regions", region.value))
+        else:
+            entries = fetch_pricing_json(url)["regions"][region.value].items()
 
         # 割引率の計算
         ret = {}
-        for key, value in data["regions"][region.value].items():
+        for key, value in entries:
             if instance_type and value["ec2:InstanceType"] != instance_type:
                 continue
 
@@ -1,7 +1,6 @@
 from typing import Dict
 from urllib.parse import quote
 
-import requests
 from rich.console import Console
 
 from enums.aws_fargate import (
@@ -11,10 +10,47 @@ from enums.aws_fargate import (
     Region,
     Term,
 )
+from services.pricing import fetch_pricing_json
 
 console = Console()
 
 
+# FargateのSavings Plans料金データのURL
+BASE_URL = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-fargate-with-arm"
+
+
+def get_index_url(
+    term: Term,
+    payment_option: PaymentOption,
+    region: Region,
+    operating_system: OperatingSystem,
+    cpu_architecture: CPUArchitecture,
+) -> str:
+    """
+    割引率の計算に使用する料金データ（index.json）のURLを返します
+
+    Args:
+        term (Term): 契約期間（1年または3年）
+        payment_option (PaymentOption): 支払いオプション（全額前払い、一部前払い、前払いなし）
+        region (Region): AWSリージョン
+        operating_system (OperatingSystem): オペレーティングシステム
+        cpu_architecture (CPUArchitecture): CPUアーキテクチャ
+
+    Returns:
+        str: 料金データのURL
+    """
+    path_parameters = "/".join(
+        [
+            quote(term.value),
+            quote(payment_option.value),
+            quote(region.value),
+            quote(operating_system.value),
+            quote(cpu_architecture.value),
+        ]
+    )
+    return f"{BASE_URL}/{path_parameters}/index.json"
+
+
 def get_discount_rate(
     term: Term = Term.ONE_YEAR,
     payment_option: PaymentOption = PaymentOption.PARTIAL_UPFRONT,
@@ -40,22 +76,12 @@ def get_discount_rate(
         Optional[float]: 割引率（0.0-1.0の範囲）またはNone（取得失敗時）
     """
     # APIのURLを構築
-    base_url = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-fargate-with-arm"
-    path_parameters = "/".join(
-        [
-            quote(term.value),
-            quote(payment_option.value),
-            quote(region.value),
-            quote(operating_system.value),
-            quote(cpu_architecture.value),
-        ]
+    url = get_index_url(
+        term, payment_option, region, operating_system, cpu_architecture
     )
-    url = f"{base_url}/{path_parameters}/index.json"
 
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_pricing_json(url)
 
         # 割引率の計算
         ret = {}
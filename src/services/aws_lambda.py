@@ -1,14 +1,44 @@
 from typing import Dict
 from urllib.parse import quote
 
-import requests
 from rich.console import Console
 
 from enums.aws_lambda import PaymentOption, Region, Term
+from services.pricing import fetch_pricing_json
 
 console = Console()
 
 
+# LambdaのSavings Plans料金データのURL
+BASE_URL = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-lambda"
+
+
+def get_index_url(
+    term: Term,
+    payment_option: PaymentOption,
+    region: Region,
+) -> str:
+    """
+    割引率の計算に使用する料金データ（index.json）のURLを返します
+
+    Args:
+        term (Term): 契約期間（1年または3年）
+        payment_option (PaymentOption): 支払いオプション（全額前払い、一部前払い、前払いなし）
+        region (Region): AWSリージョン
+
+    Returns:
+        str: 料金データのURL
+    """
+    path_parameters = "/".join(
+        [
+            quote(term.value),
+            quote(payment_option.value),
+            quote(region.value),
+        ]
+    )
+    return f"{BASE_URL}/{path_parameters}/index.json"
+
+
 def get_discount_rate(
     term: Term = Term.ONE_YEAR,
     payment_option: PaymentOption = PaymentOption.PARTIAL_UPFRONT,
@@ -25,20 +55,10 @@ def get_discount_rate(
         Dict[str, float]: 割引率の辞書
     """
     # APIのURLを構築
-    base_url = "https://b0.p.awsstatic.com/pricing/2.0/meteredUnitMaps/computesavingsplan/USD/current/compute-savings-plan-lambda"
-    path_parameters = "/".join(
-        [
-            quote(term.value),
-            quote(payment_option.value),
-            quote(region.value),
-        ]
-    )
-    url = f"{base_url}/{path_parameters}/index.json"
+    url = get_index_url(term, payment_option, region)
 
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_pricing_json(url)
 
         # 割引率の計算
         ret = {}
@@ -0,0 +1,118 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 接続・読み込みのタイムアウト（秒）の既定値
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+# 再試行の回数と、再試行までの待ち時間（0.5秒, 1秒, 2秒, ...、上限あり）の既定値
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_BACKOFF_MAX = 10.0
+
+# 再試行するステータスコード
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 同じホストに同時に接続する数の上限
+DEFAULT_POOL_SIZE = 10
+
+_http_config = {
+    "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+    "read_timeout": DEFAULT_READ_TIMEOUT,
+    "retries": DEFAULT_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+    "pool_size": DEFAULT_POOL_SIZE,
+}
+_session = None
+_lock = threading.Lock()
+
+
+def configure_http(
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    pool_size: int = DEFAULT_POOL_SIZE,
+):
+    """
+    HTTPクライアントの設定を変更します（次に取得するセッションから反映されます）
+
+    Args:
+        connect_timeout (float): 接続のタイムアウト（秒）
+        read_timeout (float): 読み込みのタイムアウト（秒）
+        retries (int): 接続エラー・5xx・429の場合に再試行する回数
+        backoff_factor (float): 再試行までの待ち時間の係数（指数的に増加します）
+        pool_size (int): 同じホストに同時に接続する数の上限（超えたリクエストは接続が空くまで待ちます）
+    """
+    global _session
+    with _lock:
+        _http_config.update(
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            pool_size=pool_size,
+        )
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session() -> requests.Session:
+    """
+    接続を再利用する共有のセッションを返します
+
+    Returns:
+        requests.Session: 再試行とコネクションプールを設定したセッション
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            retry = Retry(
+                total=_http_config["retries"],
+                backoff_factor=_http_config["backoff_factor"],
+                backoff_max=DEFAULT_BACKOFF_MAX,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            # 同じホストへの接続が上限に達した場合は、空くまで待つ
+            adapter = HTTPAdapter(
+                pool_connections=_http_config["pool_size"],
+                pool_maxsize=_http_config["pool_size"],
+                max_retries=retry,
+                pool_block=True,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            _session = session
+        return _session
+
+
+def http_get(
+    url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False
+) -> requests.Response:
+    """
+    共有のセッションでGETリクエストを送信します
+
+    Args:
+        url (str): URL
+        headers (Dict[str, str], optional): 追加のリクエストヘッダー
+        stream (bool): レスポンスの本文を逐次読み込むかどうか
+
+    Returns:
+        requests.Response: レスポンス（再試行後も5xx・429の場合はそのステータスのまま返します）
+    """
+    return get_session().get(
+        url,
+        headers=headers,
+        stream=stream,
+        timeout=(_http_config["connect_timeout"], _http_config["read_timeout"]),
+    )
@@ -0,0 +1,139 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Tuple
+
+# 読み飛ばす空白
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# 値の後に続く文字（数値の後にこれ以外の文字が続く場合は、数値の途中で区切られている）
+DELIMITERS = " \t\n\r,}]"
+
+_decoder = json.JSONDecoder()
+
+
+class _StreamReader:
+    """
+    バイト列のチャンクからJSONを少しずつ読み込むクラス
+
+    読み込み済みのうち解析を終えた部分は破棄するため、
+    バッファには解析中の値とチャンク1つ分程度しか保持しません。
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        # 解析を終えた部分を破棄してから、次のチャンクを追加する
+        if self._eof:
+            return False
+        self._buf = self._buf[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._pos = WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting {' or '.join(repr(c) for c in chars)}", self._buf, self._pos
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 数値の後に区切りの文字がない場合（"-1." や "12" で区切られたチャンクなど）は
+            # 続きがある可能性があるため、読み足してから解析し直す
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self._buf) or self._buf[end] not in DELIMITERS)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def enter(self, key: str):
+        self.expect("{")
+        if self.peek() == "}":
+            raise KeyError(key)
+        while True:
+            name = self.value()
+            self.expect(":")
+            if name == key:
+                return
+            self.value()
+            if self.expect(",}") == "}":
+                raise KeyError(key)
+
+    def drain(self):
+        # 残りのチャンクを読み切る（読み込み元が最後まで読まれたことを検知できるようにする）
+        for _ in self._chunks:
+            pass
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self.value()
+            if self.expect(",}") == "}":
+                return
+
+
+def iter_object_items(
+    chunks: Iterable[bytes], path: Tuple[str, ...]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    JSONのチャンクを読み込みながら、指定したパスのオブジェクトの要素を1つずつ返します
+
+    パスのオブジェクト全体を辞書として構築しないため、
+    大きな料金データから一部の要素のみを取り出す場合にメモリを節約できます。
+    最後の要素を返した後は、キャッシュへの書き込みなどを完了できるよう残りのチャンクを読み切ります。
+
+    Args:
+        chunks (Iterable[bytes]): UTF-8でエンコードされたJSONのチャンク
+        path (Tuple[str, ...]): オブジェクトまでのキーのパス（例: ("regions", "Asia Pacific (Tokyo)")）
+
+    Yields:
+        Tuple[str, Any]: オブジェクトの要素のキーと値
+
+    Raises:
+        KeyError: パスのキーが存在しない場合
+        json.JSONDecodeError: JSONの形式が正しくない場合
+    """
+    reader = _StreamReader(chunks)
+    for key in path:
+        reader.enter(key)
+    yield from reader.items()
+    reader.drain()
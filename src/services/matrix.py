@@ -0,0 +1,218 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+from itertools import product
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+import pandas as pd
+import requests
+
+import services.amazon_ec2 as amazon_ec2
+import services.aws_fargate as aws_fargate
+import services.aws_lambda as aws_lambda
+from enums import amazon_ec2 as amazon_ec2_enums
+from enums import aws_fargate as aws_fargate_enums
+from enums import aws_lambda as aws_lambda_enums
+from services.pricing import fetch_pricing
+
+# 割引率を並列で取得するスレッド数の既定値
+DEFAULT_MATRIX_WORKERS = 16
+
+
+class PricingService(str, Enum):
+    """割引率を取得するサービス"""
+
+    EC2 = "ec2"
+    FARGATE = "fargate"
+    LAMBDA = "lambda"
+
+
+# サービスごとの割引率の取得関数・料金データのURLの作成関数と、
+# 組み合わせる条件（引数名と列挙型）
+MATRIX_DIMENSIONS: Dict[
+    PricingService, Tuple[Callable, Callable, Dict[str, Type[Enum]]]
+] = {
+    PricingService.EC2: (
+        amazon_ec2.get_discount_rate,
+        amazon_ec2.get_index_url,
+        {
+            "term": amazon_ec2_enums.Term,
+            "payment_option": amazon_ec2_enums.PaymentOption,
+            "region": amazon_ec2_enums.Region,
+            "operating_system": amazon_ec2_enums.OperatingSystem,
+            "tenancy": amazon_ec2_enums.Tenancy,
+        },
+    ),
+    PricingService.FARGATE: (
+        aws_fargate.get_discount_rate,
+        aws_fargate.get_index_url,
+        {
+            "term": aws_fargate_enums.Term,
+            "payment_option": aws_fargate_enums.PaymentOption,
+            "region": aws_fargate_enums.Region,
+            "operating_system": aws_fargate_enums.OperatingSystem,
+            "cpu_architecture": aws_fargate_enums.CPUArchitecture,
+        },
+    ),
+    PricingService.LAMBDA: (
+        aws_lambda.get_discount_rate,
+        aws_lambda.get_index_url,
+        {
+            "term": aws_lambda_enums.Term,
+            "payment_option": aws_lambda_enums.PaymentOption,
+            "region": aws_lambda_enums.Region,
+        },
+    ),
+}
+
+
+@contextmanager
+def _quiet_services():
+    # 組み合わせごとのメッセージは表示せず、取得できなかった件数のみを呼び出し側で表示する
+    consoles = [amazon_ec2.console, aws_fargate.console, aws_lambda.console]
+    previous = [console.quiet for console in consoles]
+    for console in consoles:
+        console.quiet = True
+    try:
+        yield
+    finally:
+        for console, quiet in zip(consoles, previous):
+            console.quiet = quiet
+
+
+def build_combinations(
+    service: PricingService, selected: Dict[str, Optional[List[str]]]
+) -> List[Dict[str, Enum]]:
+    """
+    指定された条件の全ての組み合わせを作成します
+
+    Args:
+        service (PricingService): サービス
+        selected (Dict[str, Optional[List[str]]]): 条件ごとの値のリスト
+            （指定がない条件は全ての値を組み合わせる）
+
+    Returns:
+        List[Dict[str, Enum]]: get_discount_rateに渡す引数の組み合わせ
+
+    Raises:
+        ValueError: サービスで使用できない条件・値が指定された場合
+    """
+    _, _, dimensions = MATRIX_DIMENSIONS[service]
+    for name, values in selected.items():
+        if values and name not in dimensions:
+            raise ValueError(f"{name} は {service.value} では指定できません")
+
+    choices = []
+    for name, enum_cls in dimensions.items():
+        values = selected.get(name)
+        if not values:
+            choices.append(list(enum_cls))
+            continue
+        valid = {member.value: member for member in enum_cls}
+        invalid = [value for value in values if value not in valid]
+        if invalid:
+            raise ValueError(
+                f"{name} に無効な値が指定されました: {', '.join(invalid)}"
+                f"（指定できる値: {', '.join(valid)}）"
+            )
+        choices.append([valid[value] for value in dict.fromkeys(values)])
+    return [dict(zip(dimensions, values)) for values in product(*choices)]
+
+
+def get_discount_rate_matrix(
+    service: PricingService,
+    combinations: List[Dict[str, Enum]],
+    workers: int = DEFAULT_MATRIX_WORKERS,
+    **options,
+) -> Tuple[pd.DataFrame, int]:
+    """
+    全ての組み合わせの割引率を並列で取得し、1つの表にまとめます
+
+    Args:
+        service (PricingService): サービス
+        combinations (List[Dict[str, Enum]]): get_discount_rateに渡す引数の組み合わせ
+        workers (int): 並列で取得するスレッド数
+        **options: 全ての組み合わせに共通でget_discount_rateに渡す引数（instance_typeなど）
+
+    Returns:
+        Tuple[pd.DataFrame, int]: 条件の列・key・discount_rateの表（組み合わせの順）と、
+            割引率を取得できなかった組み合わせの数
+    """
+    get_discount_rate, _, dimensions = MATRIX_DIMENSIONS[service]
+
+    def fetch(combination: Dict[str, Enum]) -> Optional[Dict[str, float]]:
+        return get_discount_rate(**combination, **options)
+
+    with _quiet_services():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, combinations))
+
+    rows = []
+    failed = 0
+    for combination, discount_rate in zip(combinations, results):
+        if not discount_rate:
+            failed += 1
+            continue
+        values = {name: member.value for name, member in combination.items()}
+        for key, value in discount_rate.items():
+            rows.append({**values, "key": key, "discount_rate": value})
+    return pd.DataFrame(rows, columns=[*dimensions, "key", "discount_rate"]), failed
+
+
+def get_index_urls(service: PricingService) -> List[str]:
+    """
+    サービスの全ての組み合わせの料金データのURLを返します
+
+    Args:
+        service (PricingService): サービス
+
+    Returns:
+        List[str]: 料金データのURLのリスト
+    """
+    _, get_index_url, _ = MATRIX_DIMENSIONS[service]
+    return [
+        get_index_url(**combination) for combination in build_combinations(service, {})
+    ]
+
+
+def crawl_pricing(
+    urls: List[str], workers: int = DEFAULT_MATRIX_WORKERS
+) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    料金データを並列で取得し、URLの順に返します
+
+    取得済みで書き込みを待つ料金データがメモリに溜まらないよう、
+    先行して取得する数をスレッド数の2倍までに制限します。
+
+    Args:
+        urls (List[str]): 料金データのURLのリスト
+        workers (int): 並列で取得するスレッド数
+
+    Yields:
+        Tuple[str, Optional[bytes]]: URLと料金データ（存在しない組み合わせの場合はNone）
+
+    Raises:
+        requests.RequestException: 存在しない組み合わせ（403・404）以外の理由で取得できなかった場合
+    """
+
+    def fetch(url: str) -> Tuple[str, Optional[bytes]]:
+        try:
+            return url, fetch_pricing(url)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in (403, 404):
+                return url, None
+            raise
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for url in urls:
+            pending.append(executor.submit(fetch, url))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # 途中で失敗した場合は、未着手の取得を取り消す
+        executor.shutdown(cancel_futures=True)
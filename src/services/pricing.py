@@ -0,0 +1,289 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+import requests
+from rich.console import Console
+
+from services.http_client import http_get
+from services.snapshot import PricingSnapshot
+
+console = Console()
+
+# 料金データのキャッシュディレクトリの既定値
+DEFAULT_PRICING_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "aws-usage", "pricing"
+)
+
+# キャッシュを再検証せずに使用する秒数の既定値
+DEFAULT_PRICING_CACHE_TTL = 24 * 60 * 60
+
+# 料金データを少しずつ読み込む場合のチャンクのバイト数
+CHUNK_SIZE = 64 * 1024
+
+_cache_config = {
+    "cache_dir": DEFAULT_PRICING_CACHE_DIR,
+    "ttl": DEFAULT_PRICING_CACHE_TTL,
+}
+
+# 料金データを読み込むスナップショット（指定した場合は通信しない）
+_snapshot: Optional[PricingSnapshot] = None
+
+
+def configure_pricing_cache(
+    cache_dir: Optional[str] = DEFAULT_PRICING_CACHE_DIR,
+    ttl: int = DEFAULT_PRICING_CACHE_TTL,
+):
+    """
+    料金データのキャッシュの設定を変更します
+
+    Args:
+        cache_dir (str, optional): キャッシュディレクトリ（Noneの場合はキャッシュを使用しない）
+        ttl (int): キャッシュを再検証せずに使用する秒数（0の場合は毎回再検証する）
+    """
+    _cache_config["cache_dir"] = cache_dir
+    _cache_config["ttl"] = ttl
+
+
+def configure_pricing_snapshot(path: Optional[str]):
+    """
+    料金データを読み込むスナップショットを設定します
+
+    Args:
+        path (str, optional): スナップショットのパス（Noneの場合は通信して取得する）
+
+    Raises:
+        OSError: スナップショットを開けない場合
+        ValueError: スナップショットの形式が正しくない場合
+    """
+    global _snapshot
+    if _snapshot is not None:
+        _snapshot.close()
+    _snapshot = PricingSnapshot(path) if path is not None else None
+
+
+def _entry_path(cache_dir: str, url: str) -> str:
+    name = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(cache_dir, name)
+
+
+def _load_meta(entry: str, url: str) -> Optional[dict]:
+    try:
+        with open(entry + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("url") != url or not os.path.exists(entry + ".json.gz"):
+        return None
+    return meta
+
+
+def _load_entry(entry: str, url: str):
+    meta = _load_meta(entry, url)
+    if meta is None:
+        return None, None
+    try:
+        with gzip.open(entry + ".json.gz", "rb") as f:
+            return meta, f.read()
+    except (OSError, EOFError):
+        return None, None
+
+
+def _iter_entry(entry: str) -> Iterator[bytes]:
+    with gzip.open(entry + ".json.gz", "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _store_meta(entry: str, meta: dict):
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, entry + ".json")
+
+
+def _store_entry(entry: str, meta: dict, body: bytes):
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+
+    # 書き込み途中のファイルを読み込まないよう、一時ファイルから置き換える
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    with gzip.open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, entry + ".json.gz")
+    _store_meta(entry, meta)
+
+
+def _stream_entry(entry: str, meta: dict, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # チャンクを返しながらキャッシュに書き込み、最後まで読み込んだ場合のみ置き換える
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with gzip.open(tmp, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+        os.replace(tmp, entry + ".json.gz")
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    _store_meta(entry, meta)
+
+
+def _revalidate(
+    url: str, entry: str, meta: Optional[dict], stream: bool = False
+) -> Optional[requests.Response]:
+    # キャッシュがあれば条件付きで取得し、変更がなければ（304）Noneを返す
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = http_get(url, headers=headers, stream=stream)
+    if response.status_code == 304 and meta is not None:
+        response.close()
+        meta["fetched_at"] = time.time()
+        _store_meta(entry, meta)
+        return None
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def _response_meta(url: str, response: requests.Response) -> dict:
+    return {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }
+
+
+def _warn_stale(e: Exception):
+    console.print(
+        f"[yellow]警告: 料金データを再検証できなかったため、キャッシュを使用します:[/yellow] {str(e)}"
+    )
+
+
+def fetch_pricing(url: str) -> bytes:
+    """
+    料金データ（index.json）を取得します
+
+    キャッシュが有効期間内の場合は通信せずにキャッシュを返します。
+    有効期間を過ぎた場合は If-None-Match / If-Modified-Since で再検証し、
+    変更がなければ（304）キャッシュを使用します。
+
+    Args:
+        url (str): 料金データのURL
+
+    Returns:
+        bytes: レスポンスの本文
+
+    Note:
+        - スナップショットを設定した場合は、通信せずにスナップショットから読み込みます
+        - キャッシュは本文をgzipで圧縮して保存します
+        - 再検証に失敗した場合は、期限切れのキャッシュがあればそれを返します
+    """
+    if _snapshot is not None:
+        return _snapshot.read(url)
+
+    cache_dir = _cache_config["cache_dir"]
+    if cache_dir is None:
+        response = http_get(url)
+        response.raise_for_status()
+        return response.content
+
+    entry = _entry_path(cache_dir, url)
+    meta, body = _load_entry(entry, url)
+    if body is not None and time.time() - meta["fetched_at"] < _cache_config["ttl"]:
+        return body
+
+    try:
+        response = _revalidate(url, entry, meta if body is not None else None)
+        if response is None:
+            return body
+        content = response.content
+    except requests.RequestException as e:
+        if body is None:
+            raise
+        _warn_stale(e)
+        return body
+
+    _store_entry(entry, _response_meta(url, response), content)
+    return content
+
+
+def iter_pricing(url: str) -> Iterator[bytes]:
+    """
+    料金データ（index.json）を少しずつ取得します
+
+    fetch_pricingと同じくスナップショット・キャッシュを使用しますが、
+    本文全体をメモリに読み込まずにチャンクごとに返します。
+    通信した場合は、チャンクを返しながらキャッシュに書き込みます。
+
+    Args:
+        url (str): 料金データのURL
+
+    Yields:
+        bytes: レスポンスの本文のチャンク
+
+    Note:
+        - 再検証に失敗した場合は、期限切れのキャッシュがあればそれを返します
+        - 本文の受信中に失敗した場合はキャッシュを更新せずに例外を送出します
+    """
+    if _snapshot is not None:
+        yield from _snapshot.iter_chunks(url, CHUNK_SIZE)
+        return
+
+    cache_dir = _cache_config["cache_dir"]
+    if cache_dir is None:
+        with http_get(url, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(CHUNK_SIZE)
+        return
+
+    entry = _entry_path(cache_dir, url)
+    meta = _load_meta(entry, url)
+    if meta is not None and time.time() - meta["fetched_at"] < _cache_config["ttl"]:
+        yield from _iter_entry(entry)
+        return
+
+    try:
+        response = _revalidate(url, entry, meta, stream=True)
+    except requests.RequestException as e:
+        if meta is None:
+            raise
+        _warn_stale(e)
+        response = None
+    if response is None:
+        yield from _iter_entry(entry)
+        return
+
+    with response:
+        yield from _stream_entry(
+            entry, _response_meta(url, response), response.iter_content(CHUNK_SIZE)
+        )
+
+
+def fetch_pricing_json(url: str) -> dict:
+    """
+    料金データ（index.json）を取得し、JSONとして解析します
+
+    Args:
+        url (str): 料金データのURL
+
+    Returns:
+        dict: 料金データ
+    """
+    return json.loads(fetch_pricing(url))
@@ -0,0 +1,143 @@
+import json
+import os
+import zipfile
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+# スナップショットの形式のバージョン（形式を変更した場合は古いスナップショットを読み込まない）
+SNAPSHOT_FORMAT_VERSION = 1
+
+# スナップショットの作成日時などを保存するエントリ
+MANIFEST_NAME = "manifest.json"
+
+
+def entry_name(url: str) -> str:
+    """
+    料金データのURLに対応するスナップショット内のエントリ名を返します
+
+    Args:
+        url (str): 料金データのURL
+
+    Returns:
+        str: エントリ名（URLのパス）
+    """
+    return urlsplit(url).path.lstrip("/")
+
+
+def write_snapshot(path: str, items: Iterable[Tuple[str, Optional[bytes]]]) -> dict:
+    """
+    料金データをスナップショット（ZIPファイル）に書き込みます
+
+    料金データはエントリごとに圧縮するため、読み込み時は必要なエントリのみを展開できます。
+
+    Args:
+        path (str): スナップショットのパス
+        items (Iterable[Tuple[str, Optional[bytes]]]): URLと料金データ（取得できなかった場合はNone）
+
+    Returns:
+        dict: スナップショットのマニフェスト
+    """
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "entries": 0,
+        "missing": [],
+    }
+
+    # 書き込み途中のファイルを読み込まないよう、一時ファイルから置き換える
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(
+            tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9
+        ) as archive:
+            for url, body in items:
+                if body is None:
+                    manifest["missing"].append(url)
+                    continue
+                archive.writestr(entry_name(url), body)
+                manifest["entries"] += 1
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+    return manifest
+
+
+class PricingSnapshot:
+    """
+    スナップショットから料金データを読み込むクラス
+
+    開いた時点ではZIPファイルの目次とマニフェストのみを読み込み、
+    料金データは要求されたエントリのみを展開します。
+    """
+
+    def __init__(self, path: str):
+        try:
+            self._archive = zipfile.ZipFile(path)
+            manifest = json.loads(self._archive.read(MANIFEST_NAME))
+        except (zipfile.BadZipFile, KeyError) as e:
+            raise ValueError(f"スナップショットを読み込めません: {path}（{e}）") from e
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            self._archive.close()
+            raise ValueError(
+                f"対応していない形式のスナップショットです: {path}"
+                f"（バージョン {manifest.get('format_version')}）"
+            )
+        self.created_at = manifest["created_at"]
+        self._missing = set(manifest["missing"])
+
+    def read(self, url: str) -> bytes:
+        """
+        料金データを読み込みます
+
+        Args:
+            url (str): 料金データのURL
+
+        Returns:
+            bytes: 料金データ
+
+        Raises:
+            LookupError: スナップショットに料金データが含まれていない場合
+        """
+        with self._open(url) as f:
+            return f.read()
+
+    def iter_chunks(self, url: str, chunk_size: int) -> Iterator[bytes]:
+        """
+        料金データを展開しながら少しずつ読み込みます
+
+        Args:
+            url (str): 料金データのURL
+            chunk_size (int): 1回に読み込むバイト数
+
+        Yields:
+            bytes: 料金データのチャンク
+
+        Raises:
+            LookupError: スナップショットに料金データが含まれていない場合
+        """
+        with self._open(url) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def _open(self, url: str) -> IO[bytes]:
+        # ZipFileは読み込み位置をロックで管理するため、複数のスレッドから同時に開ける
+        try:
+            return self._archive.open(entry_name(url))
+        except KeyError:
+            if url in self._missing:
+                raise LookupError(
+                    f"スナップショットの作成時に料金データを取得できませんでした: {url}"
+                ) from None
+            raise LookupError(
+                f"スナップショットに料金データが含まれていません: {url}"
+            ) from None
+
+    def close(self):
+        self._archive.close()
@@ -0,0 +1,175 @@
+import json
+import os
+import sys
+from contextlib import nullcontext
+from enum import Enum
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+
+from readers.fixed_point import COST_DIGITS, format_cost
+
+# 一度に書き込む行数
+BATCH_ROWS = 100_000
+
+
+class OutputFormat(str, Enum):
+    """使用状況データの出力形式"""
+
+    TABLE = "table"
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+
+def level_output_path(output: str, group_keys: List[str]) -> str:
+    """
+    組み合わせごとに出力する場合の出力先のパスを返します
+
+    Args:
+        output (str): 指定された出力先のパス（例: usage.csv）
+        group_keys (List[str]): 集計に使用した列
+
+    Returns:
+        str: 集計に使用した列を含むパス（例: usage.aws_account_id-month.csv）
+    """
+    root, ext = os.path.splitext(output)
+    return f"{root}.{'-'.join(group_keys)}{ext}"
+
+
+def iter_batches(df: pd.DataFrame, batch_rows: int = BATCH_ROWS) -> Iterator:
+    """
+    データフレームを行数で区切って返します
+
+    Args:
+        df (pd.DataFrame): データフレーム
+        batch_rows (int): 1回に返す行数
+
+    Yields:
+        pd.DataFrame: 区切ったデータフレーム
+    """
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start : start + batch_rows]
+
+
+def _cost_text(cost: pd.Series, missing: str) -> pd.Series:
+    text = format_cost(cost)
+    return text.mask(cost.isna().to_numpy(), missing)
+
+
+def _json_values(values: pd.Series) -> pd.Series:
+    # 値の種類ごとに一度だけJSONに変換し、カテゴリのコードで全行に展開する
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype("category")
+    table = pd.Series(
+        [json.dumps(value, ensure_ascii=False) for value in values.cat.categories]
+        + ["null"]
+    )
+    return pd.Series(
+        table.to_numpy()[values.cat.codes.to_numpy()], index=values.index, dtype=object
+    )
+
+
+def _write_csv(f, batches: Iterator[pd.DataFrame]):
+    header = True
+    for batch in batches:
+        if "cost" in batch.columns:
+            batch = batch.assign(cost=_cost_text(batch["cost"], ""))
+        batch.to_csv(f, header=header, index=False)
+        header = False
+
+
+def _write_jsonl(f, batches: Iterator[pd.DataFrame]):
+    for batch in batches:
+        if batch.empty:
+            continue
+        line = "{"
+        for i, column in enumerate(batch.columns):
+            if column == "cost":
+                values = _cost_text(batch[column], "null")
+            else:
+                values = _json_values(batch[column])
+            separator = "," if i else ""
+            line = line + f"{separator}{json.dumps(column)}:" + values
+        f.write("\n".join((line + "}").tolist()) + "\n")
+
+
+def _to_arrow(batch: pd.DataFrame, schema=None):
+    import pyarrow as pa
+
+    # カテゴリ型は辞書型ではなく文字列の列として保存する
+    batch = batch.astype(
+        {
+            column: object
+            for column in batch.columns
+            if isinstance(batch[column].dtype, pd.CategoricalDtype)
+        }
+    )
+    exact = "cost" in batch.columns and is_integer_dtype(batch["cost"].dtype)
+    if exact:
+        cost = _cost_text(batch["cost"], None)
+        batch = batch.drop(columns="cost")
+    table = pa.Table.from_pandas(batch, preserve_index=False)
+    if exact:
+        # 固定小数点のcostは小数点以下10桁の10進数として保存する
+        table = table.append_column(
+            "cost",
+            pa.array(cost.tolist(), pa.string()).cast(pa.decimal128(38, COST_DIGITS)),
+        )
+    if schema is not None:
+        table = table.cast(schema)
+    return table
+
+
+def _write_parquet(path: str, batches: Iterator[pd.DataFrame]):
+    # pyarrowはParquetで出力する場合のみ必要なため、ここでインポートする
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for batch in batches:
+            table = _to_arrow(batch, writer.schema if writer else None)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_usage(
+    frames: List[Tuple[str, pd.DataFrame]],
+    output_format: OutputFormat,
+    output: Optional[str] = None,
+):
+    """
+    サービスごとの使用状況データを、先頭にservice列を加えて1つの出力先に書き込みます
+
+    表を作成せずに、データフレームから一定の行数ずつ書き込みます。
+    costはCSV・JSON Linesでは小数点以下10桁までの10進数で、
+    Parquetでは数値（固定小数点の場合は小数点以下10桁の10進数型）で書き込みます。
+
+    Args:
+        frames (List[Tuple[str, pd.DataFrame]]): サービス名と使用状況データのリスト
+        output_format (OutputFormat): 出力形式（csv, jsonl, parquet）
+        output (str, optional): 出力先のパス（省略時は標準出力、Parquetの場合は必須）
+    """
+
+    def batches() -> Iterator[pd.DataFrame]:
+        for name, df in frames:
+            for batch in iter_batches(df):
+                yield batch.assign(service=name)[["service", *df.columns]]
+
+    if output_format == OutputFormat.PARQUET:
+        _write_parquet(output, batches())
+        return
+
+    write = _write_csv if output_format == OutputFormat.CSV else _write_jsonl
+    target = (
+        open(output, "w", encoding="utf-8", newline="")
+        if output is not None
+        else nullcontext(sys.stdout)
+    )
+    with target as f:
+        write(f, batches())
@@ -0,0 +1,33 @@
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from readers.fixed_point import to_fixed_cost  # noqa: E402
+
+
+class ToFixedCostTest(unittest.TestCase):
+    def test_mixed_valid_and_invalid_rows(self):
+        # 変換できない行が混ざっても、有効な行は浮動小数点数を経由せずに変換する
+        values = pd.Series(
+            ["12345678.1234567891", "abc", "-1.5e3", "", None, "-0.0000000001"],
+            index=[10, 11, 12, 13, 14, 15],
+        )
+        expected = pd.Series(
+            [123456781234567891, pd.NA, -15000000000000, pd.NA, pd.NA, -1],
+            index=[10, 11, 12, 13, 14, 15],
+            dtype="Int64",
+        )
+        pd.testing.assert_series_equal(to_fixed_cost(values), expected)
+
+    def test_decimal_rows_keep_precision(self):
+        values = pd.Series(["abc", "9.2233720368547758e8", "1e30"])
+        expected = pd.Series([pd.NA, 9223372036854775800, pd.NA], dtype="Int64")
+        pd.testing.assert_series_equal(to_fixed_cost(values), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import main  # noqa: E402
+from main import GroupBy, extract_usage  # noqa: E402
+
+main.console.quiet = True
+
+
+def write_cur(path: str, month: str):
+    # item_descriptionが空の行を含むCUR
+    pd.DataFrame(
+        {
+            "aws_account_id": ["111122223333"] * 4,
+            "month": [month] * 4,
+            "usage_type": [
+                "APN1-Fargate-vCPU-Hours:perCPU",
+                "APN1-Fargate-GB-Hours",
+                "APN1-Fargate-GB-Hours",
+                "APN1-BoxUsage:t3.micro",
+            ],
+            "item_description": ["Fargate", "", "SavingsPlanNegation x", ""],
+            "cost": [1.25, 2.5, -0.5, 4.0],
+        }
+    ).to_csv(path, index=False)
+
+
+class StateDirTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for month in ["2024-11", "2024-12"]:
+            path = os.path.join(
+                self.tmp.name, f"monthly-report-{month}-111122223333.csv"
+            )
+            write_cur(path, month)
+            self.files.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_same_as_plain_run(self, group_by, **options):
+        services = ["Fargate", "EC2"]
+        expected = extract_usage(self.files, services, group_by=group_by, **options)
+        state_dir = os.path.join(self.tmp.name, "state")
+        # 1回目は全てのファイルを読み込み、2回目は保存済みの集計結果のみを使用する
+        for _ in range(2):
+            actual = extract_usage(
+                self.files, services, group_by=group_by, state_dir=state_dir, **options
+            )
+            for name in services:
+                pd.testing.assert_frame_equal(
+                    actual[name].reset_index(drop=True),
+                    expected[name].reset_index(drop=True),
+                    check_categorical=False,
+                )
+
+    def test_group_by_month_keeps_blank_descriptions(self):
+        self.assert_same_as_plain_run([GroupBy.MONTH])
+
+    def test_group_by_item_description(self):
+        self.assert_same_as_plain_run([GroupBy.ITEM_DESCRIPTION])
+
+    def test_exact(self):
+        self.assert_same_as_plain_run([GroupBy.MONTH, GroupBy.USAGE_TYPE], exact=True)
+
+    def test_no_negation(self):
+        self.assert_same_as_plain_run([GroupBy.MONTH], negation=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
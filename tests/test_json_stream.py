@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.json_stream import iter_object_items  # noqa: E402
+
+DOCUMENT = json.dumps(
+    {
+        "regions": {
+            "Asia Pacific (Tokyo)": {
+                "a": 12345,
+                "b": -1.5e10,
+                "c": {"rate": "0.0123", "values": [0.25, -3, 1e-7, True, None]},
+                "d": "東京",
+                "e": 0,
+            },
+            "US East (N. Virginia)": {"a": 1},
+        }
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+
+PATH = ("regions", "Asia Pacific (Tokyo)")
+
+
+class IterObjectItemsTest(unittest.TestCase):
+    def test_split_number(self):
+        chunks = [b'{"regions":{"R":{"a":12345,"b":-1.', b"5e10}}}"]
+        self.assertEqual(
+            list(iter_object_items(chunks, ("regions", "R"))),
+            [("a", 12345), ("b", -1.5e10)],
+        )
+
+    def test_split_at_every_offset(self):
+        expected = list(json.loads(DOCUMENT)["regions"]["Asia Pacific (Tokyo)"].items())
+        for offset in range(1, len(DOCUMENT)):
+            chunks = [DOCUMENT[:offset], DOCUMENT[offset:]]
+            with self.subTest(offset=offset):
+                self.assertEqual(list(iter_object_items(chunks, PATH)), expected)
+
+    def test_one_byte_chunks(self):
+        expected = list(json.loads(DOCUMENT)["regions"]["Asia Pacific (Tokyo)"].items())
+        chunks = [DOCUMENT[i : i + 1] for i in range(len(DOCUMENT))]
+        self.assertEqual(list(iter_object_items(chunks, PATH)), expected)
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            list(iter_object_items([DOCUMENT], ("regions", "EU (Paris)")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+from itertools import combinations
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import main  # noqa: E402
+from main import GroupBy, extract_usage, rollup_usage  # noqa: E402
+
+main.console.quiet = True
+
+
+class RollupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cur.csv")
+        # item_description・monthが空の行を含むCUR
+        pd.DataFrame(
+            {
+                "aws_account_id": ["111122223333"] * 5,
+                "month": ["2024-11", "2024-11", "2024-12", "", "2024-12"],
+                "usage_type": [
+                    "APN1-Fargate-vCPU-Hours:perCPU",
+                    "APN1-Fargate-GB-Hours",
+                    "APN1-Fargate-GB-Hours",
+                    "APN1-Fargate-GB-Hours",
+                    "APN1-Fargate-vCPU-Hours:perCPU",
+                ],
+                "item_description": ["Fargate", "", "Fargate", "Fargate", ""],
+                "cost": [1.25, 2.5, 0.75, 8.0, 4.0],
+            }
+        ).to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_levels_match_direct_group_by(self):
+        group_by = list(GroupBy)
+        base = extract_usage([self.path], ["Fargate"], group_by=group_by, dropna=False)
+        levels = dict(
+            (tuple(keys), df) for keys, df in rollup_usage(base["Fargate"], group_by)
+        )
+        for size in range(1, len(group_by) + 1):
+            for keys in combinations(group_by, size):
+                expected = extract_usage([self.path], ["Fargate"], group_by=list(keys))
+                actual = levels[tuple(main.get_group_keys(list(keys)))]
+                pd.testing.assert_frame_equal(
+                    actual.reset_index(drop=True),
+                    expected["Fargate"].reset_index(drop=True),
+                    check_categorical=False,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()